@@ -1,14 +1,35 @@
 import pygame
-from moviepy.video.io.VideoFileClip import VideoFileClip
 import os
+import sys
+
+from framepack import write_pack
+from settings import WIDTH, HEIGHT
 
 pygame.init()
 
-clip = VideoFileClip("video/end.mp4")
-os.makedirs("video/end_frames", exist_ok=True)
+FRAME_DIR = "video/end_frames"
+PACK_PATH = "video/end.pack"  # what main.py plays, one file at the game's resolution
+VIDEO_FPS = 24
+
+def frames_from_video():
+    from moviepy.video.io.VideoFileClip import VideoFileClip
+
+    clip = VideoFileClip("video/end.mp4")
+    os.makedirs(FRAME_DIR, exist_ok=True)
+
+    for i, frame in enumerate(clip.iter_frames()):
+        surf = pygame.surfarray.make_surface(frame.swapaxes(0,1))
+        pygame.image.save(surf, f"{FRAME_DIR}/frame_{i:03}.png")
+        yield surf
+
+    clip.close()
 
-for i, frame in enumerate(clip.iter_frames()):
-    surf = pygame.surfarray.make_surface(frame.swapaxes(0,1))
-    pygame.image.save(surf, f"video/end_frames/frame_{i:03}.png")
+def frames_from_png():
+    for f in sorted(os.listdir(FRAME_DIR)):
+        yield pygame.image.load(os.path.join(FRAME_DIR, f))
 
-clip.close()
+# python add_video.py        -> extract PNGs from end.mp4 and pack them
+# python add_video.py --png  -> only pack the PNGs already in video/end_frames
+frames = frames_from_png() if "--png" in sys.argv else frames_from_video()
+count = write_pack(PACK_PATH, (pygame.transform.scale(f, (WIDTH, HEIGHT)) for f in frames), (WIDTH, HEIGHT), VIDEO_FPS)
+print(f"packed {count} frames into {PACK_PATH}")
@@ -0,0 +1,77 @@
+import hashlib
+import os
+
+import pygame
+
+from settings import *
+
+# Pre-scaled copies of the images, named after the source hash and target size
+BAKE_DIR = os.path.join("img", ".baked")
+
+
+def baked_path(path, size, flip=False):
+    """Where the baked version of path at size lives (changes when the source changes)."""
+    with open(path, "rb") as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    suffix = "_flip" if flip else ""
+    return os.path.join(BAKE_DIR, f"{stem}_{digest}_{size[0]}x{size[1]}{suffix}.png")
+
+
+def bake_image(path, size, flip=False):
+    """Decodes, scales (and flips) one source image and writes it to the bake dir."""
+    img = pygame.transform.scale(pygame.image.load(path), size)
+    if flip:
+        img = pygame.transform.flip(img, True, False)
+    try:
+        os.makedirs(BAKE_DIR, exist_ok=True)
+        pygame.image.save(img, baked_path(path, size, flip))
+    except (OSError, pygame.error):
+        pass  # read-only install: just use the freshly scaled image
+    return img
+
+
+def load_image(path, size, flip=False, alpha=True):
+    """Loads an image at its in-game size, preferring the baked copy.
+
+    On a miss the image is scaled the slow way once and baked for next time.
+    """
+    baked = baked_path(path, size, flip)
+    if os.path.exists(baked):
+        img = pygame.image.load(baked)
+    else:
+        img = bake_image(path, size, flip)
+    return img.convert_alpha() if alpha else img.convert()
+
+
+def translucent(img, alpha):
+    """See-through copy of img, made once instead of copy() + set_alpha() per frame."""
+    img = img.copy()
+    img.set_alpha(alpha)
+    return img
+
+
+def asset_manifest():
+    """Every (path, size, flip) the game loads, so they can all be baked up front."""
+    player_size = (TILE_SIZE - 10, TILE_SIZE - 10)
+    manifest = []
+    for i in range(3):
+        path = os.path.join("img", f"player_walk_{i}.png")
+        manifest += [(path, player_size, False), (path, player_size, True)]
+    manifest += [
+        (os.path.join("img", "bush.png"), (TILE_SIZE, TILE_SIZE), False),
+        (os.path.join("img", "coin.png"), (30, 30), False),
+        (os.path.join("img", "Final_poster.png"), (WIDTH, HEIGHT), False),
+        (os.path.join("img", "heart.png"), (30, 30), False),
+    ]
+    for i in range(len(LEVELS)):
+        manifest.append((os.path.join("img", f"ghost{i + 1}.png"), (30, 30), False))
+    return manifest
+
+
+if __name__ == "__main__":
+    # python assets.py -> bake everything ahead of time (e.g. when packaging)
+    pygame.init()
+    for path, size, flip in asset_manifest():
+        bake_image(path, size, flip)
+        print("baked", baked_path(path, size, flip))
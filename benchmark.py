@@ -0,0 +1,330 @@
+"""Headless benchmarks for the game (no window, no sound card needed).
+
+python benchmark.py                      -> every case, JSON on stdout
+python benchmark.py --out bench.json     -> same, written to a file
+python benchmark.py --case level2        -> just one case
+python benchmark.py --bot                -> levels played by the bot instead of the script
+python benchmark.py --case soak --minutes 30   -> memory over many bot games
+
+Each case runs in its own process so the peak RSS belongs to that case only.
+Gameplay is driven by a fixed input script (or the bot) and fixed seeds, one
+simulation tick per frame, so two runs do exactly the same work.
+"""
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+CASES = ["menu", "level1", "level2", "level3", "full_game", "end_animation"]
+
+# (ticks, keys) segments, played in a loop. 1 = LEFT, 2 = RIGHT, 4 = UP, 8 = DOWN
+INPUT_SCRIPT = [
+    (30, 2), (30, 8), (20, 2 | 4), (40, 1), (25, 4), (15, 0), (30, 8 | 1), (20, 2),
+]
+
+
+def scripted_input(script):
+    """A read_input() for GameScene that plays the script's keys tick by tick."""
+    keys = [k for ticks, k in script for _ in range(ticks)]
+    tick = 0
+
+    def read():
+        nonlocal tick
+        k = keys[tick % len(keys)]
+        tick += 1
+        return k
+    return read
+
+
+class _Manager:
+    """Stands in for the SceneManager: remembers switch() / quit() calls."""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.switched = None
+
+    def switch(self, scene):
+        self.switched = scene
+
+    def quit(self):
+        self.switched = "quit"
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _rss_mb():
+    # Current, not peak, resident memory (Linux only; peak elsewhere)
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024), 1)
+    except (OSError, ValueError, AttributeError):
+        return _peak_rss_mb()
+
+
+def _summary(prof, frames, elapsed):
+    from profiler import PHASES
+
+    p50, p95, p99 = prof.percentiles(50, 95, 99)
+    return {
+        "frames": frames,
+        "seconds": round(elapsed, 3),
+        "fps": round(frames / elapsed, 1),
+        "frame_ms": {"p50": round(p50, 3), "p95": round(p95, 3), "p99": round(p99, 3)},
+        "phase_ms": {name: round(sum(prof.phases[name]) / len(prof.phases[name]), 4)
+                     for name in PHASES + sorted(set(prof.phases) - set(PHASES)) if name in prof.phases},
+    }
+
+
+def bench_level(level_idx, frames, seed, use_bot=False):
+    import pygame
+    import main
+    from bot import Bot
+    from profiler import FrameProfiler
+
+    random.seed(seed)
+    main.profiler = prof = FrameProfiler(history=frames)
+    prof.toggle()
+    manager = _Manager(main.screen)
+
+    def new_scene():
+        scene = main.GameScene(seed, scripted_input(INPUT_SCRIPT))
+        if level_idx:
+            scene.sim.start_level(level_idx)
+        if use_bot:
+            scene.read_input = Bot(scene.sim)
+        scene.manager = manager
+        scene.enter()
+        return scene
+
+    scene = new_scene()
+    restarts = 0
+    start = time.perf_counter()
+    for _ in range(frames):
+        pygame.event.pump()
+        prof.mark("events")
+        scene.update(main.SIM_STEP)  # exactly one simulation tick
+        prof.mark("update")
+        if manager.switched:
+            # Died or cleared the level: play it again from the start
+            manager.switched = None
+            restarts += 1
+            scene = new_scene()
+            prof.mark("update")
+        scene.draw(main.screen)
+        prof.mark("draw")
+        scene.present()
+        prof.mark("flip")
+        prof.end_frame()
+    result = _summary(prof, frames, time.perf_counter() - start)
+    result["restarts"] = restarts
+    return result
+
+
+def play_through(seed, prof, max_frames=None):
+    """The bot plays every level once through GameScene, drawing every frame.
+
+    A lost level doesn't end the run, it goes on with the next one, so each
+    run covers every level and its transitions. Returns (frames, levels won).
+    """
+    import pygame
+    import main
+    from bot import Bot
+
+    main.profiler = prof
+    manager = _Manager(main.screen)
+    frames = won = 0
+    for level_idx in range(len(main.LEVELS)):
+        scene = main.GameScene(seed)
+        if level_idx:
+            scene.sim.start_level(level_idx)
+        scene.read_input = Bot(scene.sim)
+        scene.manager = manager
+        scene.enter()
+        while not manager.switched and frames != max_frames:
+            pygame.event.pump()
+            prof.mark("events")
+            scene.update(main.SIM_STEP)
+            prof.mark("update")
+            if manager.switched:
+                break
+            scene.draw(main.screen)
+            prof.mark("draw")
+            scene.present()
+            prof.mark("flip")
+            prof.end_frame()
+            frames += 1
+        won += manager.switched is not None and not isinstance(manager.switched, main.GameOverScene)
+        manager.switched = None
+    return frames, won
+
+
+def bench_full_game(frames, seed):
+    from profiler import FrameProfiler
+
+    random.seed(seed)
+    prof = FrameProfiler(history=100000)
+    prof.toggle()
+    start = time.perf_counter()
+    played, won = play_through(seed, prof)
+    result = _summary(prof, played, time.perf_counter() - start)
+    result["levels_won"] = won
+    return result
+
+
+def soak(minutes, seed):
+    """Bot games back to back for `minutes`; memory should level off, not keep growing."""
+    from profiler import FrameProfiler
+
+    random.seed(seed)
+    end = time.perf_counter() + minutes * 60
+    games, rss = 0, [_rss_mb()]
+    while time.perf_counter() < end:
+        play_through(seed + games, FrameProfiler())
+        games += 1
+        rss.append(_rss_mb())
+    return {
+        "minutes": minutes,
+        "games": games,
+        "rss_mb": rss,
+        "growth_mb": round(rss[-1] - rss[1], 1) if len(rss) > 1 else None,
+    }
+
+
+def bench_menu(frames, seed):
+    import pygame
+    import main
+    from profiler import FrameProfiler
+
+    random.seed(seed)
+    prof = FrameProfiler(history=frames)
+    prof.toggle()
+    scene = main.MenuScene()
+    scene.manager = _Manager(main.screen)
+    start = time.perf_counter()
+    for _ in range(frames):
+        pygame.event.pump()
+        prof.mark("events")
+        scene.draw(main.screen)
+        prof.mark("draw")
+        scene.present()
+        prof.mark("flip")
+        prof.end_frame()
+    return _summary(prof, frames, time.perf_counter() - start)
+
+
+def bench_end_animation(frames, seed):
+    # Real-time playback: measures start-up, frames shown vs dropped, memory
+    import pygame
+    import main
+
+    scene = main.end_animation()
+    manager = _Manager(main.screen)
+    scene.manager = manager
+    clock = pygame.time.Clock()
+
+    start = time.perf_counter()
+    scene.enter()
+    first_frame = None
+    shown = 0
+    last = None
+    while not manager.switched:
+        pygame.event.pump()
+        scene.update(0)
+        if scene.frame is not None and scene.frame is not last:
+            last = scene.frame
+            shown += 1
+            if first_frame is None:
+                first_frame = time.perf_counter() - start
+        scene.draw(main.screen)
+        scene.present()
+        clock.tick(scene.fps)
+    return {
+        "seconds": round(time.perf_counter() - start, 3),
+        "first_frame_ms": round((first_frame or 0) * 1000, 1),
+        "frames_total": len(scene.source),
+        "frames_shown": shown,
+        "frames_dropped": len(scene.source) - shown,
+    }
+
+
+def run_case(name, frames, seed, use_bot=False, minutes=10):
+    if name == "menu":
+        result = bench_menu(frames, seed)
+    elif name == "end_animation":
+        result = bench_end_animation(frames, seed)
+    elif name == "full_game":
+        result = bench_full_game(frames, seed)
+    elif name == "soak":
+        result = soak(minutes, seed)
+    elif name.startswith("level"):
+        result = bench_level(int(name[len("level"):]) - 1, frames, seed, use_bot)
+    else:
+        raise ValueError(f"unknown case {name!r}, pick one of {CASES}")
+    result["peak_rss_mb"] = _peak_rss_mb()
+    return result
+
+
+def run_all(cases, frames, seed, use_bot=False):
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "frames": frames,
+        "seed": seed,
+        "input": "bot" if use_bot else "script",
+        "cases": {},
+    }
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in cases:
+        out = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--case", name,
+             "--frames", str(frames), "--seed", str(seed)] + (["--bot"] if use_bot else []),
+            cwd=here, capture_output=True, text=True,
+        )
+        if out.returncode != 0:
+            report["cases"][name] = {"error": out.stderr.strip().splitlines()[-1:]}
+            continue
+        report["cases"][name] = json.loads(out.stdout.strip().splitlines()[-1])
+    return report
+
+
+def _arg(flag, default):
+    if flag in sys.argv:
+        return sys.argv[sys.argv.index(flag) + 1]
+    return default
+
+
+if __name__ == "__main__":
+    frames = int(_arg("--frames", 1200))
+    seed = int(_arg("--seed", 1))
+    case = _arg("--case", None)
+    use_bot = "--bot" in sys.argv
+
+    if case:
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+        print(json.dumps(run_case(case, frames, seed, use_bot, float(_arg("--minutes", 10)))))
+    else:
+        report = run_all(CASES, frames, seed, use_bot)
+        text = json.dumps(report, indent=2)
+        out = _arg("--out", None)
+        if out:
+            with open(out, "w") as f:
+                f.write(text + "\n")
+        print(text)
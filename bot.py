@@ -0,0 +1,239 @@
+"""Autopilot that plays the game through the normal input path.
+
+Bot(sim) is a read_input(): call it once per tick and feed the result to
+Simulation.step() (or hand it to GameScene). It walks shortest paths over
+the tile grid to the nearest coin, runs for a bush when a ghost gets close
+and waits there until the ghost has wandered off.
+
+python bot.py  -> plays a few full games headless and prints the results
+"""
+from collections import deque
+
+from pathfinding import STEPS
+from simulation import LEFT, RIGHT, UP, DOWN
+
+DANGER = 4  # ghost this many tiles away (by path) -> go hide
+SAFE = 6  # hide (or keep running for a bush) until no ghost is this close
+KEEP_AWAY = 2  # paths don't walk towards a ghost this close, if there's another way
+FAR = 8  # ghost distances are only measured this far out
+STUCK = 20 * 60  # ticks without a coin -> stop dodging and just go for them
+NODE_BUDGET = 600  # tiles the planner may expand per tick
+AIM = 2  # px; close enough to a tile centre
+
+
+class Bot:
+    """Coin-collecting, ghost-dodging autopilot for one Simulation.
+
+    Planning is BFS over the TileGrid, written as a generator that stops
+    after NODE_BUDGET tiles and carries on next tick, so no tick costs more
+    than that. The budget is counted in tiles, not time, so the bot plays a
+    seeded game the same way on every machine.
+    """
+
+    def __init__(self, sim, rng=None, node_budget=NODE_BUDGET):
+        self.sim = sim
+        self.node_budget = node_budget
+        self.left = 0  # budget left this tick
+        self.grid = None
+        self.path = []  # tiles still to walk through
+        self.goal = None  # "coin", "bush" or "flee": where the path leads
+        self.plan = None  # planner generator in progress
+        self.planning = None  # what it was asked for
+        self.coins_left = None
+        self.since_coin = 0
+
+    def _new_level(self):
+        self.grid = self.sim.grid
+        self.bush_tiles = {self.grid.tile_at(*b.topleft) for b in self.sim.bushes}
+        self.path, self.goal, self.plan, self.planning = [], None, None, None
+
+    def _ghost_distance(self):
+        """Generator: path distance to the nearest ghost for every tile up to FAR away."""
+        grid = self.grid
+        dist = {}
+        queue = deque()
+        for m in self.sim.monsters:
+            tile = grid.tile_at(*m.rect.center)
+            if tile not in dist:
+                dist[tile] = 0
+                queue.append(tile)
+        while queue:
+            tile = queue.popleft()
+            d = dist[tile] + 1
+            if d <= FAR:
+                x, y = tile
+                for sx, sy in STEPS:
+                    nxt = (x + sx, y + sy)
+                    if nxt not in dist and not grid.is_wall(*nxt):
+                        dist[nxt] = d
+                        queue.append(nxt)
+            self.left -= 1
+            if self.left <= 0:
+                yield
+        return dist
+
+    def _bfs(self, start, goal, near):
+        """Generator: shortest path from start to the nearest coin / bush.
+
+        With ghost distances in `near` it never steps onto a tile within
+        KEEP_AWAY of a ghost that is closer to one than the tile before.
+        goal "flee" leads to the reachable tile farthest from the ghosts.
+        Returns the path, or None.
+        """
+        grid = self.grid
+        goals = self.sim.coins if goal == "coin" else self.bush_tiles if goal == "bush" else ()
+        prev = {start: None}
+        queue = deque([start])
+        best = (near.get(start, FAR + 1), start)
+        while queue:
+            tile = queue.popleft()
+            if tile in goals:
+                return _path(prev, tile)
+            here = near.get(tile, FAR + 1)
+            if here > best[0]:
+                best = (here, tile)
+            x, y = tile
+            for sx, sy in STEPS:
+                nxt = (x + sx, y + sy)
+                if nxt in prev or grid.is_wall(*nxt):
+                    continue
+                d = near.get(nxt, FAR + 1)
+                if d <= KEEP_AWAY and d < here:
+                    continue
+                prev[nxt] = tile
+                queue.append(nxt)
+            self.left -= 1
+            if self.left <= 0:
+                yield
+        if goal == "flee" and best[1] != start:
+            return _path(prev, best[1])
+        return None
+
+    def _think(self, want, here):
+        """Generator: the (goal, path) to follow; safe options first, then anything."""
+        if self.since_coin > STUCK:
+            path = yield from self._bfs(here, "coin", {})
+            return "coin", path or []
+
+        near = yield from self._ghost_distance()
+        if want == "coin":
+            # Rather wait in a bush than walk past a ghost to a coin
+            options = [("coin", near), ("bush", near), ("flee", near), ("coin", {})]
+        else:
+            options = [("bush", near), ("flee", near), ("coin", near), ("bush", {})]
+        for goal, ghosts in options:
+            if goal == "bush" and not self.bush_tiles:
+                continue
+            path = yield from self._bfs(here, goal, ghosts)
+            if path is not None:
+                return goal, path
+        return None, []
+
+    def _plan(self, want, here):
+        # Keep walking the current path while it still leads to what we want
+        if self.path and self.goal == want and (want != "coin" or self.path[-1] in self.sim.coins):
+            return
+        if self.plan is None or self.planning != want:
+            self.plan = self._think(want, here)
+            self.planning = want
+        self.left = self.node_budget
+        try:
+            next(self.plan)
+        except StopIteration as done:
+            self.goal, self.path = done.value
+            self.plan = self.planning = None
+
+    def _threat(self):
+        """Path distance in tiles to the nearest ghost (the flow field is towards us)."""
+        nearest = None
+        flow = self.sim.flow
+        for m in self.sim.monsters:
+            d = flow.distance(*self.grid.tile_at(*m.rect.center))
+            if d >= 0 and (nearest is None or d < nearest):
+                nearest = d
+        return nearest
+
+    def _steer(self):
+        player = self.sim.player.rect
+        while self.path:
+            cx, cy = self.grid.tile_rect(*self.path[0]).center
+            dx, dy = cx - player.centerx, cy - player.centery
+            if abs(dx) > AIM or abs(dy) > AIM:
+                break
+            self.path.pop(0)
+        else:
+            return 0
+
+        keys = 0
+        if dx > AIM: keys |= RIGHT
+        elif dx < -AIM: keys |= LEFT
+        if dy > AIM: keys |= DOWN
+        elif dy < -AIM: keys |= UP
+        return keys
+
+    def __call__(self):
+        sim = self.sim
+        if sim.grid is not self.grid:
+            self._new_level()
+        player = sim.player
+        here = self.grid.tile_at(*player.rect.center)
+        threat = self._threat()
+        if len(sim.coins) != self.coins_left:
+            self.coins_left, self.since_coin = len(sim.coins), 0
+        self.since_coin += 1
+        stuck = self.since_coin > STUCK
+
+        # Ghosts only wander while we hide, so wait for them to go away
+        if player.is_hidden and threat is not None and threat <= SAFE and not stuck:
+            self.path, self.goal = [], None
+            return 0
+
+        # A ghost moved next to the coming stretch of the path: plan again
+        for m in sim.monsters:
+            gx, gy = self.grid.tile_at(*m.rect.center)
+            if any(abs(tx - gx) <= 1 and abs(ty - gy) <= 1 for tx, ty in self.path[:3]):
+                self.path = []
+                break
+
+        # SAFE > DANGER, so one step either way doesn't flip between coin and bush
+        limit = SAFE if "bush" in (self.goal, self.planning) else DANGER
+        danger = threat is not None and threat <= limit and not (stuck or player.is_hidden)
+        self._plan("bush" if danger else "coin", here)
+        return self._steer()
+
+
+def _path(prev, tile):
+    path = []
+    while prev[tile] is not None:
+        path.append(tile)
+        tile = prev[tile]
+    return path[::-1]
+
+
+def play(seed, max_ticks=20 * 60 * 60, **params):
+    """Lets the bot play a whole game; returns (result, levels cleared, ticks, health)."""
+    from simulation import Simulation
+
+    sim = Simulation(seed, **params)
+    bot = Bot(sim)
+    cleared = 0
+    for _ in range(max_ticks):
+        events = sim.step(bot())
+        if "dead" in events:
+            return "dead", cleared, sim.ticks, sim.player.health
+        if "cleared" in events:
+            cleared += 1
+            if sim.is_last_level():
+                return "won", cleared, sim.ticks, sim.player.health
+            sim.start_level(sim.level_idx + 1)
+    return "timeout", cleared, sim.ticks, sim.player.health
+
+
+if __name__ == "__main__":
+    import time
+
+    for seed in range(5):
+        start = time.perf_counter()
+        result, cleared, ticks, health = play(seed)
+        print(f"seed {seed}: {result}, {cleared} levels, {ticks} ticks, "
+              f"health {health:.1f}, {time.perf_counter() - start:.2f} s")
@@ -65,10 +65,20 @@ class Camera:
         self.zoom = 1.0
 
     def apply(self, surface):
-        w, h = surface.get_size()
-        scaled = pygame.transform.scale(surface, (int(w*self.zoom), int(h*self.zoom)))
         offset_x = random.randint(-self.shake, self.shake)
         offset_y = random.randint(-self.shake, self.shake)
+
+        # No zoom: a single offset blit, nothing gets scaled
+        if abs(self.zoom - 1.0) < 0.005:
+            screen.blit(surface, (offset_x, offset_y))
+            return
+
+        # Zoomed: only scale the part of the surface that ends up on screen
+        w, h = surface.get_size()
+        vw = min(w, int(WIDTH / self.zoom) + 1)
+        vh = min(h, int(HEIGHT / self.zoom) + 1)
+        view = surface.subsurface((0, 0, vw, vh))
+        scaled = pygame.transform.scale(view, (int(vw*self.zoom), int(vh*self.zoom)))
         screen.blit(scaled, (offset_x, offset_y))
 
 # ---------- PLAYER ----------
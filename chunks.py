@@ -0,0 +1,66 @@
+from collections import OrderedDict
+
+import pygame
+
+
+class ChunkRenderer:
+    """Draws the static level (floors, walls, bushes) from cached NxN tile chunks.
+
+    A chunk is rendered the first time it comes into view and kept in an LRU
+    cache; chunks that scroll far away are evicted. Drawing only blits the
+    chunks that intersect the viewport, so the cost depends on the window
+    size and not on the size of the map.
+    """
+
+    def __init__(self, level_map, tile_size, floor_color, wall_color, bush_img, chunk_tiles=8, max_chunks=64):
+        self.level_map = level_map
+        self.tile_size = tile_size
+        self.floor_color = floor_color
+        self.wall_color = wall_color
+        self.bush_img = bush_img
+        self.chunk_tiles = chunk_tiles
+        self.chunk_px = chunk_tiles * tile_size
+        self.max_chunks = max_chunks
+        self.cols = len(level_map[0])
+        self.rows = len(level_map)
+        self.size = (self.cols * tile_size, self.rows * tile_size)
+        self.cache = OrderedDict()
+
+    def chunk(self, cx, cy):
+        key = (cx, cy)
+        surf = self.cache.get(key)
+        if surf is not None:
+            self.cache.move_to_end(key)
+            return surf
+
+        surf = self._render(cx, cy)
+        self.cache[key] = surf
+        if len(self.cache) > self.max_chunks:
+            self.cache.popitem(last=False)  # least recently seen
+        return surf
+
+    def _render(self, cx, cy):
+        ts, n = self.tile_size, self.chunk_tiles
+        x0, y0 = cx * n, cy * n
+        x1, y1 = min(x0 + n, self.cols), min(y0 + n, self.rows)
+        surf = pygame.Surface(((x1 - x0) * ts, (y1 - y0) * ts)).convert()
+        surf.fill(self.floor_color)
+        for y in range(y0, y1):
+            row = self.level_map[y]
+            for x in range(x0, x1):
+                r = pygame.Rect((x - x0) * ts, (y - y0) * ts, ts, ts)
+                if row[x] == '#': surf.fill(self.wall_color, r)
+                elif row[x] == 'B': surf.blit(self.bush_img, r)
+        return surf
+
+    def draw(self, surf, offset):
+        """Blits the visible chunks with the level's top-left at `offset` on surf."""
+        ox, oy = offset
+        w, h = surf.get_size()
+        cp = self.chunk_px
+        first_cx, first_cy = max(0, -ox // cp), max(0, -oy // cp)
+        last_cx = min((self.size[0] - 1) // cp, (w - 1 - ox) // cp)
+        last_cy = min((self.size[1] - 1) // cp, (h - 1 - oy) // cp)
+        for cy in range(first_cy, last_cy + 1):
+            for cx in range(first_cx, last_cx + 1):
+                surf.blit(self.chunk(cx, cy), (ox + cx * cp, oy + cy * cp))
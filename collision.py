@@ -0,0 +1,60 @@
+import pygame
+
+
+class TileGrid:
+    """Wall occupancy of a level: one byte per tile (1 = wall).
+
+    Collision queries only look at the tiles a rect overlaps, so a move costs
+    the same no matter how many walls the map has.
+    """
+
+    def __init__(self, level_map, tile_size):
+        self.tile_size = tile_size
+        self.rows = len(level_map)
+        self.cols = len(level_map[0])
+        self.cells = bytearray(1 if char == '#' else 0 for row in level_map for char in row)
+
+    def is_wall(self, tx, ty):
+        # Everything outside the map counts as wall
+        if 0 <= tx < self.cols and 0 <= ty < self.rows:
+            return self.cells[ty * self.cols + tx] == 1
+        return True
+
+    def tile_at(self, x, y):
+        return int(x) // self.tile_size, int(y) // self.tile_size
+
+    def tile_rect(self, tx, ty):
+        ts = self.tile_size
+        return pygame.Rect(tx * ts, ty * ts, ts, ts)
+
+    def walls_near(self, rect):
+        """Yields the wall tiles overlapping rect (at most four for a tile-sized rect)."""
+        ts = self.tile_size
+        for ty in range(rect.top // ts, (rect.bottom - 1) // ts + 1):
+            for tx in range(rect.left // ts, (rect.right - 1) // ts + 1):
+                if self.is_wall(tx, ty):
+                    yield self.tile_rect(tx, ty)
+
+    def collides(self, rect):
+        return next(self.walls_near(rect), None) is not None
+
+    def slide(self, rect, dx, dy):
+        """Moves rect in place, pushing it flush against any wall it runs into."""
+        rect.x += dx
+        for w in list(self.walls_near(rect)):
+            if rect.colliderect(w):
+                if dx > 0: rect.right = w.left
+                if dx < 0: rect.left = w.right
+
+        rect.y += dy
+        for w in list(self.walls_near(rect)):
+            if rect.colliderect(w):
+                if dy > 0: rect.bottom = w.top
+                if dy < 0: rect.top = w.bottom
+
+    def step(self, rect, dx, dy):
+        """Moves rect in place, cancelling each axis that would end inside a wall."""
+        rect.x += dx
+        if self.collides(rect): rect.x -= dx
+        rect.y += dy
+        if self.collides(rect): rect.y -= dy
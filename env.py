@@ -0,0 +1,346 @@
+"""Reinforcement-learning style environments for automated playtesting.
+
+MazeEnv       one game, straight through Simulation: reset() / step(keys)
+BatchMazeEnv  N games of one level kept in NumPy arrays, all stepped in one call
+
+An action is the simulation's input bitmask (LEFT | UP ...), 0-15. An episode
+is one level: it ends when the player dies, clears it or runs out of time.
+
+python env.py  -> steps per second of the batched env
+"""
+import random
+
+import numpy as np
+
+from collision import TileGrid
+from pathfinding import FlowField, STEPS
+from settings import *
+from visibility import for_level
+from simulation import (
+    Simulation, LEFT, RIGHT, UP, DOWN, DIRECTIONS,
+    PLAYER_SIZE, PLAYER_SPEED, GHOST_SIZE, COIN_SIZE, HEALTH_PACK_SIZE,
+    COIN_CHANCE, GHOST_DAMAGE, HEAL_FACTOR, ghost_count, ghost_speed,
+)
+
+# Reward per event
+REWARDS = {"coin": 1.0, "hit": -0.05, "health": 0.5, "dead": -10.0, "cleared": 10.0}
+MAX_TICKS = 60 * FPS  # an episode is cut off after a minute of game time
+
+
+class MazeEnv:
+    """One game through the real Simulation, so it follows the game exactly.
+
+    Observations are a dict of NumPy arrays, laid out like one game of
+    BatchMazeEnv.
+    """
+
+    def __init__(self, level_idx=0, seed=None, max_ticks=MAX_TICKS, levels=LEVELS):
+        self.level_idx = level_idx
+        self.max_ticks = max_ticks
+        self.levels = levels
+        self.rng = random.Random(seed)  # seeds for the episodes
+        self.sim = None
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = self.rng.randrange(2**32)
+        self.sim = Simulation(seed, levels=self.levels)
+        if self.level_idx:
+            self.sim.start_level(self.level_idx)
+        self.ticks = 0
+        return self.observation()
+
+    def step(self, keys):
+        """Returns (observation, reward, done, info) after one tick."""
+        events = self.sim.step(keys)
+        self.ticks += 1
+        reward = sum(REWARDS.get(e, 0.0) for e in events)
+        truncated = self.ticks >= self.max_ticks
+        done = "dead" in events or "cleared" in events or truncated
+        return self.observation(), reward, done, {"events": events, "truncated": truncated}
+
+    def observation(self):
+        sim = self.sim
+        coins = np.zeros((sim.grid.rows, sim.grid.cols), bool)
+        for tx, ty in sim.coins:
+            coins[ty, tx] = True
+        return {
+            "player": np.array(sim.player.rect.topleft),
+            "health": np.float64(sim.player.health),
+            "hidden": np.bool_(sim.player.is_hidden),
+            "monsters": np.array([m.rect.topleft for m in sim.monsters]),
+            "coins": coins,
+            "health_pack": np.array(sim.health_pack.topleft if sim.health_pack else (-1, -1)),
+        }
+
+
+def _round(v):
+    # What assigning a float to a pygame.Rect coordinate does: half away from zero
+    return (np.sign(v) * np.floor(np.abs(v) + 0.5)).astype(np.int64)
+
+
+def _overlap(ax, ay, asize, bx, by, bsize):
+    # pygame.Rect.colliderect for squares
+    return (ax < bx + bsize) & (bx < ax + asize) & (ay < by + bsize) & (by < ay + asize)
+
+
+class BatchMazeEnv:
+    """N independent games of one level, stepped together with array maths.
+
+    Same rules and numbers as a Simulation with ai_scheduler.full_rate()
+    (every ghost decides every tick), but randomness comes from one NumPy
+    generator, so a game here is not the same game as a Simulation with the
+    same seed. Ghosts chase with a next-step table holding the FlowField of
+    every tile a player has stood on, each built once the first time, so
+    after the first few ticks a tick rarely runs a BFS.
+
+    Finished games are reset inside step(); the returned observation is then
+    already the first one of the next episode.
+    """
+
+    def __init__(self, n, level_idx=0, seed=None, max_ticks=MAX_TICKS, levels=LEVELS):
+        self.n = n
+        self.max_ticks = max_ticks
+        self.rng = np.random.default_rng(seed)
+        level_map = levels[level_idx]
+        grid = TileGrid(level_map, TILE_SIZE)
+        self.rows, self.cols = grid.rows, grid.cols
+
+        # Walls and bushes with a one tile wall border, so lookups never go out of range
+        tiles = np.array([list(row) for row in level_map])
+        self.walls = np.pad(tiles == '#', 1, constant_values=True)
+        self.bush = np.pad(tiles == 'B', 1, constant_values=False)
+        self.coin_tiles = tiles == '.'
+        self.floor_tiles = np.argwhere(tiles != '#')  # (ty, tx), same order as get_level_data
+        self.bush_tiles = np.argwhere(tiles == 'B')
+
+        # next_step[row, from floor] = index into step_dx / step_dy (0 = stay), one
+        # row per target floor tile, built the first time the player stands there
+        self.floor_id = np.full(self.rows * self.cols, -1, np.int64)
+        self.floor_flat = self.floor_tiles[:, 0] * self.cols + self.floor_tiles[:, 1]
+        self.floor_id[self.floor_flat] = np.arange(len(self.floor_flat))
+        self.codes = {step: i + 1 for i, step in enumerate(STEPS)}
+        self.flow = FlowField(grid)
+        self.sight = for_level(level_map)
+        self.row_of = np.full(len(self.floor_flat), -1, np.int64)  # target floor -> row
+        self.next_step = np.zeros((min(64, len(self.floor_flat)), len(self.floor_flat)), np.int8)
+        self.n_rows = 0
+        self.step_dx = np.array([0] + [s[0] for s in STEPS])
+        self.step_dy = np.array([0] + [s[1] for s in STEPS])
+        self.dir_dx = np.array([d[0] for d in DIRECTIONS])
+        self.dir_dy = np.array([d[1] for d in DIRECTIONS])
+
+        self.n_monsters = ghost_count(level_idx)
+        self.monster_speed = ghost_speed(level_idx)
+
+        m = self.n_monsters
+        self.px = np.zeros(n, np.int64)
+        self.py = np.zeros(n, np.int64)
+        self.health = np.zeros(n)
+        self.hidden = np.zeros(n, bool)
+        self.mx = np.zeros((n, m), np.int64)
+        self.my = np.zeros((n, m), np.int64)
+        self.mdir = np.zeros((n, m), np.int64)
+        self.mtimer = np.zeros((n, m))
+        self.coins = np.zeros((n, self.rows, self.cols), bool)
+        self.coins_left = np.zeros(n, np.int64)
+        self.total_coins = np.zeros(n, np.int64)
+        self.pack_x = np.full(n, -1, np.int64)
+        self.pack_y = np.full(n, -1, np.int64)
+        self.pack_spawned = np.zeros(n, bool)
+        self.ticks = np.zeros(n, np.int64)
+
+    def reset(self, games=None):
+        """Starts new episodes for the given game indices (default: all)."""
+        idx = np.arange(self.n) if games is None else np.asarray(games)
+        k, ts, rng = len(idx), TILE_SIZE, self.rng
+
+        self.coins[idx] = self.coin_tiles & (rng.random((k, self.rows, self.cols)) < COIN_CHANCE)
+        self.coins_left[idx] = self.total_coins[idx] = self.coins[idx].sum(axis=(1, 2))
+
+        if len(self.bush_tiles):
+            spawn = self.bush_tiles[rng.integers(len(self.bush_tiles), size=k)]
+            self.px[idx], self.py[idx] = spawn[:, 1] * ts, spawn[:, 0] * ts
+        else:
+            self.px[idx], self.py[idx] = 40, 40
+        self.health[idx] = MAX_HEALTH
+        self.hidden[idx] = False
+
+        spots = self.floor_tiles[rng.integers(len(self.floor_tiles), size=(k, self.n_monsters))]
+        self.mx[idx], self.my[idx] = spots[..., 1] * ts, spots[..., 0] * ts
+        self.mdir[idx] = rng.integers(len(DIRECTIONS), size=(k, self.n_monsters))
+        self.mtimer[idx] = 0
+
+        self.pack_x[idx] = self.pack_y[idx] = -1
+        self.pack_spawned[idx] = False
+        self.ticks[idx] = 0
+        return self.observation()
+
+    def observation(self):
+        return {
+            "player": np.stack([self.px, self.py], axis=1),
+            "health": self.health.copy(),
+            "hidden": self.hidden.copy(),
+            "monsters": np.stack([self.mx, self.my], axis=2),
+            "coins": self.coins.copy(),
+            "health_pack": np.stack([self.pack_x, self.pack_y], axis=1),
+        }
+
+    def _wall(self, tx, ty):
+        return self.walls[np.clip(ty + 1, 0, self.rows + 1), np.clip(tx + 1, 0, self.cols + 1)]
+
+    def _collides(self, x, y, size):
+        # TileGrid.collides for a rect smaller than a tile: check its four corners
+        ts = TILE_SIZE
+        x0, x1 = x // ts, (x + size - 1) // ts
+        y0, y1 = y // ts, (y + size - 1) // ts
+        return self._wall(x0, y0) | self._wall(x1, y0) | self._wall(x0, y1) | self._wall(x1, y1)
+
+    def _slide_player(self, dx, dy):
+        # TileGrid.slide: move each axis, then push flush against the wall hit
+        ts, size = TILE_SIZE, PLAYER_SIZE
+        x = self.px + dx
+        col = np.where(dx > 0, (x + size - 1) // ts, x // ts)
+        hit = (dx != 0) & (self._wall(col, self.py // ts) | self._wall(col, (self.py + size - 1) // ts))
+        self.px = np.where(hit, np.where(dx > 0, col * ts - size, (col + 1) * ts), x)
+
+        y = self.py + dy
+        row = np.where(dy > 0, (y + size - 1) // ts, y // ts)
+        hit = (dy != 0) & (self._wall(self.px // ts, row) | self._wall((self.px + size - 1) // ts, row))
+        self.py = np.where(hit, np.where(dy > 0, row * ts - size, (row + 1) * ts), y)
+
+    def _chase_rows(self, target):
+        """next_step rows for an array of target floor ids, building missing ones."""
+        missing = (target >= 0) & (self.row_of[target] < 0)
+        for t in (np.unique(target[missing]).tolist() if missing.any() else ()):
+            if self.n_rows == len(self.next_step):
+                more = min(len(self.next_step), len(self.floor_flat) - len(self.next_step))
+                self.next_step = np.concatenate([self.next_step, np.zeros((more, len(self.floor_flat)), np.int8)])
+            ty, tx = self.floor_tiles[t]
+            self.flow.update(tx, ty)
+            self.next_step[self.n_rows] = [self.codes.get(self.flow.next_step[i], 0) for i in self.floor_flat]
+            self.row_of[t] = self.n_rows
+            self.n_rows += 1
+        return self.row_of[target]
+
+    def _move_monsters(self):
+        ts, half, speed = TILE_SIZE, GHOST_SIZE // 2, self.monster_speed
+        pcx, pcy = self.px + PLAYER_SIZE // 2, self.py + PLAYER_SIZE // 2
+        mcx, mcy = self.mx + half, self.my + half
+        mtx, mty = mcx // ts, mcy // ts
+        sees = self.sight.visible_array(mtx, mty, (pcx // ts)[:, None], (pcy // ts)[:, None])
+        chasing = ~self.hidden[:, None] & sees
+
+        # Chase: next tile from the table, or straight at the player on its tile
+        target = self.floor_id[(pcy // ts) * self.cols + pcx // ts]
+        here = self.floor_id[mty * self.cols + mtx]
+        rows = self._chase_rows(target)
+        code = np.where((target[:, None] >= 0) & (here >= 0), self.next_step[rows[:, None], here], 0)
+        gx = np.where(code > 0, (mtx + self.step_dx[code]) * ts + ts // 2, pcx[:, None])
+        gy = np.where(code > 0, (mty + self.step_dy[code]) * ts + ts // 2, pcy[:, None])
+        chase_dx = np.clip(gx - mcx, -speed, speed)
+        chase_dy = np.clip(gy - mcy, -speed, speed)
+
+        # Wander while the player hides or is out of sight: new random direction when the timer runs out
+        renew = ~chasing & (self.mtimer <= 0)
+        count = int(renew.sum())
+        if count:
+            self.mdir[renew] = self.rng.integers(len(DIRECTIONS), size=count)
+            self.mtimer[renew] = self.rng.integers(40, 101, size=count)
+        self.mtimer = np.where(chasing, self.mtimer, self.mtimer - 1.5)
+
+        dx = np.where(chasing, chase_dx, self.dir_dx[self.mdir] * speed)
+        dy = np.where(chasing, chase_dy, self.dir_dy[self.mdir] * speed)
+
+        # TileGrid.step: undo each axis that ends inside a wall
+        x = _round(self.mx + dx)
+        self.mx = np.where(self._collides(x, self.my, GHOST_SIZE), _round(x - dx), x)
+        y = _round(self.my + dy)
+        self.my = np.where(self._collides(self.mx, y, GHOST_SIZE), _round(y - dy), y)
+
+    def _pick_coins(self, alive):
+        # Coins sit centred in their tile, so only the 3x3 tiles around the player can touch it
+        ts, inset = TILE_SIZE, (TILE_SIZE - COIN_SIZE) // 2
+        games = np.arange(self.n)
+        ctx = (self.px + PLAYER_SIZE // 2) // ts
+        cty = (self.py + PLAYER_SIZE // 2) // ts
+        picked = np.zeros(self.n, np.int64)
+        for oy in (-1, 0, 1):
+            for ox in (-1, 0, 1):
+                tx, ty = ctx + ox, cty + oy
+                inside = (tx >= 0) & (tx < self.cols) & (ty >= 0) & (ty < self.rows)
+                tx, ty = np.clip(tx, 0, self.cols - 1), np.clip(ty, 0, self.rows - 1)
+                hit = alive & inside & self.coins[games, ty, tx] & _overlap(
+                    self.px, self.py, PLAYER_SIZE, tx * ts + inset, ty * ts + inset, COIN_SIZE)
+                self.coins[games[hit], ty[hit], tx[hit]] = False
+                picked += hit
+        self.coins_left -= picked
+        return picked
+
+    def step(self, keys):
+        """Advances every game one tick with keys[i] as game i's input.
+
+        Returns (observation, reward, done, info); info holds the per-game
+        "dead", "cleared" and "truncated" flags of the episodes that ended.
+        """
+        keys = np.asarray(keys)
+        dx = np.where(keys & RIGHT, PLAYER_SPEED, np.where(keys & LEFT, -PLAYER_SPEED, 0))
+        dy = np.where(keys & DOWN, PLAYER_SPEED, np.where(keys & UP, -PLAYER_SPEED, 0))
+        self._slide_player(dx, dy)
+        half = PLAYER_SIZE // 2
+        self.hidden = self.bush[(self.py + half) // TILE_SIZE + 1, (self.px + half) // TILE_SIZE + 1]
+
+        self._move_monsters()
+
+        touching = _overlap(self.px[:, None], self.py[:, None], PLAYER_SIZE, self.mx, self.my, GHOST_SIZE)
+        hits = np.where(self.hidden, 0, touching.sum(axis=1))
+        self.health -= hits * GHOST_DAMAGE
+        dead = self.health <= 0
+        alive = ~dead
+
+        # The health pack is checked before this tick's coins can spawn one
+        healed = alive & (self.pack_x >= 0) & _overlap(
+            self.px, self.py, PLAYER_SIZE, self.pack_x, self.pack_y, HEALTH_PACK_SIZE)
+        self.health = np.where(healed, np.minimum(self.health + self.health * HEAL_FACTOR, MAX_HEALTH), self.health)
+        self.pack_x[healed] = self.pack_y[healed] = -1
+
+        picked = self._pick_coins(alive)
+        spawn = ~self.pack_spawned & (picked > 0) & (self.coins_left <= self.total_coins // 2)
+        count = int(spawn.sum())
+        if count:
+            tiles = self.floor_tiles[self.rng.integers(len(self.floor_tiles), size=count)]
+            inset = (TILE_SIZE - HEALTH_PACK_SIZE) // 2
+            self.pack_x[spawn] = tiles[:, 1] * TILE_SIZE + inset
+            self.pack_y[spawn] = tiles[:, 0] * TILE_SIZE + inset
+            self.pack_spawned |= spawn
+
+        cleared = alive & (self.coins_left == 0)
+        self.ticks += 1
+        truncated = alive & ~cleared & (self.ticks >= self.max_ticks)
+        reward = (picked * REWARDS["coin"] + hits * REWARDS["hit"] + healed * REWARDS["health"]
+                  + dead * REWARDS["dead"] + cleared * REWARDS["cleared"])
+
+        done = dead | cleared | truncated
+        if done.any():
+            self.reset(np.flatnonzero(done))
+        info = {"dead": dead, "cleared": cleared, "truncated": truncated}
+        return self.observation(), reward, done, info
+
+
+def benchmark(n=1024, ticks=500, level_idx=0):
+    """Environment steps per second with random inputs."""
+    import time
+
+    env = BatchMazeEnv(n, level_idx, seed=0)
+    env.reset()
+    rng = np.random.default_rng(1)
+    actions = rng.integers(16, size=(ticks, n))
+    start = time.perf_counter()
+    for keys in actions:
+        env.step(keys)
+    return n * ticks / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    for level_idx in range(len(LEVELS)):
+        print(f"level {level_idx + 1}: {benchmark(level_idx=level_idx):,.0f} steps/s")
@@ -0,0 +1,60 @@
+import mmap
+import struct
+import zlib
+
+import pygame
+
+# File layout (little endian):
+#   header  magic "FRPK", version, width, height, fps, frame count, index offset
+#   frames  zlib-compressed raw RGB, one blob per frame, back to back
+#   index   frame count + 1 absolute offsets (frame i = offsets[i]:offsets[i+1])
+MAGIC = b"FRPK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHIQ")
+
+
+def write_pack(path, frames, size, fps, level=6):
+    """Writes surfaces (already at `size`) into one packed frame file, streaming."""
+    offsets = []
+    with open(path, "wb") as f:
+        f.write(b"\0" * HEADER.size)  # filled in once we know the frame count
+        for surf in frames:
+            offsets.append(f.tell())
+            f.write(zlib.compress(pygame.image.tobytes(surf, "RGB"), level))
+        offsets.append(f.tell())
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, size[0], size[1], fps, len(offsets) - 1, offsets[-1]))
+    return len(offsets) - 1
+
+
+class FramePack:
+    """Memory-mapped reader for files written by write_pack().
+
+    Frames are decompressed straight out of the mapping and wrapped in a
+    surface without copying the pixels again.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, w, h, self.fps, count, index_at = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} frame pack")
+        self.size = (w, h)
+        self.offsets = struct.unpack_from(f"<{count + 1}Q", self.data, index_at)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def frame_bytes(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        with memoryview(self.data)[start:end] as blob:
+            return zlib.decompress(blob)
+
+    def frame(self, i):
+        return pygame.image.frombuffer(self.frame_bytes(i), self.size, "RGB")
+
+    def close(self):
+        self.data.close()
+        self.file.close()
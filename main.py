@@ -2,77 +2,37 @@ import pygame
 import random
 import os
 import sys
-import math
+import time
+
+from assets import load_image, translucent
+from bot import Bot
+from chunks import ChunkRenderer
+from framepack import FramePack
+from particles import ParticleSystem
+from profiler import FrameProfiler
+from render import LevelRenderer
+from replay import InputRecorder, ReplayInput, read_replay
+from scenes import Scene, SceneManager
+from settings import *
+from simulation import Simulation, Monster, LEFT, RIGHT, UP, DOWN
+from text import render_text
+from video import PngFrames, VideoScene
 
 # ---------------- 1. INITIALIZATION ----------------
 pygame.init()
 pygame.mixer.init()
 
-TILE_SIZE = 40
-FPS = 60
-MAX_HEALTH = 100
-
-# YOUR ORIGINAL MAPS
-LEVELS = [
-    [
-        "#############################",
-        "#......##....##....##.......#",
-        "#.####..##..##..####..####..#",
-        "#..BB.....#.....BB......B...#",
-        "#..BB..#..#.#..BB..######...#",
-        "#......#....#......#........#",
-        "#####.......#.........####..#",
-        "#....###....#......#........#",
-        "#..BB..#..###..BB......BB.#.#",
-        "#..BB...........BB......BB..#",
-        "#.####..##..##..####..##..###",
-        "#......##...B##....##.......#",
-        "#..BB.......................#",
-        "#......#....#...B..#.....#.B#",
-        "#############################",
-    ],
-    [
-        "#############################",
-        "#..BB....#..#....BB....#..#.#",
-        "#..##....##.#....##....##...#",
-        "#......BB......BB......BB...#",
-        "####..######..######..####..#",
-        "#......#......#......#......#",
-        "#....###...######...##..##..#",
-        "#......BB..............BB..##",
-        "#..##....####....##....##.#.#",
-        "#..B........#....BB....#..#.#",
-        "#.......B...................#",
-        "####..######..######.B##....#",
-        "#......#....B.#......#...#..#",
-        "#..BB.....#........BB....#..#",
-        "#############################",
-    ],
-    [
-        "#############################",
-        "#....BB....#..#............##",
-        "#.##..#..#.#.#..###..###B...#",
-        "#.BB.....#...B..#....BB#....#",
-        "#.#....#.##.##.##.#.#..#....#",
-        "#.#..#..............#......##",
-        "#.......###....###..#....#..#",
-        "#.......BBB...............BB#",
-        "#..............BBB.........B#",
-        "#.#B.#..###....###..#.B#...##",
-        "#.#..#..............#..#....#",
-        "#.#..###.##B.#..#.###..#.#..#",
-        "#.B......#......#....BB#....#",
-        "#....#..#..##..B.#..#.#.....#",
-        "#############################",
-    ]
-]
-
-WIDTH = len(LEVELS[0][0]) * TILE_SIZE
-HEIGHT = len(LEVELS[0]) * TILE_SIZE
+RENDER_FPS = FPS  # frame cap for drawing, 0 = uncapped
+SIM_STEP = 1000 / FPS  # ms per simulation tick
+MAX_FRAME_TIME = 250  # ms, avoids a catch-up spiral after a long stall
+DIRTY_RECTS = False  # only redraw what moved (F2 toggles it in-game)
+RECORD_DIR = None  # --record DIR saves every session's input there
+AUTOPILOT = False  # --bot lets the bot play
 
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("The FOREST (Survive the forest!)")
 clock = pygame.time.Clock()
+profiler = FrameProfiler()  # F3 shows the frame-time overlay
 
 # Colors
 FLOOR_COLOR = (140, 80, 20)
@@ -85,34 +45,43 @@ GOLD = (255, 215, 0)
 # ---------------- 2. ASSETS ----------------
 player_walk_right = []
 player_walk_left = []
+player_sprites = {}
 bush_img = None
 
 def load_assets(tile_size=TILE_SIZE):
-    global player_walk_right, player_walk_left, bush_img, menu_bg, coin_img, health_pack_img
+    global player_walk_right, player_walk_left, player_sprites, bush_img, menu_bg, coin_img, health_pack_img
     
+    # Everything comes pre-scaled from img/.baked (see assets.py)
     # Player walking frames
+    player_size = (tile_size-10, tile_size-10)
     player_walk_right = [
-        pygame.image.load(os.path.join("img", f"player_walk_{i}.png")).convert_alpha()
+        load_image(os.path.join("img", f"player_walk_{i}.png"), player_size)
+        for i in range(3)
+    ]
+    player_walk_left = [
+        load_image(os.path.join("img", f"player_walk_{i}.png"), player_size, flip=True)
         for i in range(3)
     ]
-    player_walk_right = [pygame.transform.scale(img, (tile_size-10, tile_size-10)) for img in player_walk_right]
-    player_walk_left = [pygame.transform.flip(img, True, False) for img in player_walk_right]
+
+    # Every player variant made once: (facing_right, is_hidden) -> walk frames
+    player_sprites = {
+        (True, False): player_walk_right,
+        (False, False): player_walk_left,
+        (True, True): [translucent(img, 128) for img in player_walk_right],
+        (False, True): [translucent(img, 128) for img in player_walk_left],
+    }
 
     # Bush
-    bush_img = pygame.image.load(os.path.join("img", "bush.png")).convert_alpha()
-    bush_img = pygame.transform.scale(bush_img, (tile_size, tile_size))
+    bush_img = load_image(os.path.join("img", "bush.png"), (tile_size, tile_size))
 
     # Coin
-    coin_img = pygame.image.load(os.path.join("img", "coin.png")).convert_alpha()
-    coin_img = pygame.transform.scale(coin_img, (30, 30))
+    coin_img = load_image(os.path.join("img", "coin.png"), (30, 30))
 
     # Menu background
-    menu_bg = pygame.image.load(os.path.join("img", "Final_poster.png")).convert()
-    menu_bg = pygame.transform.scale(menu_bg, (WIDTH, HEIGHT))
+    menu_bg = load_image(os.path.join("img", "Final_poster.png"), (WIDTH, HEIGHT), alpha=False)
 
     # Health pack
-    health_pack_img = pygame.image.load(os.path.join("img", "heart.png")).convert_alpha()
-    health_pack_img = pygame.transform.scale(health_pack_img, (30, 30))
+    health_pack_img = load_image(os.path.join("img", "heart.png"), (30, 30))
 
 
 load_assets()
@@ -127,18 +96,43 @@ scary_sound = pygame.mixer.Sound("video/end.wav")
 
 # ---------------- 3. CLASSES ----------------
 class Camera:
-    def __init__(self):
+    """Follows the player over levels bigger than the window, plus the shake."""
+    def __init__(self, view_size=(WIDTH, HEIGHT)):
+        self.view_w, self.view_h = view_size
+        self.scroll_x = self.scroll_y = 0
+        self.shake_x = self.shake_y = 0
         self.offset_x = 0
         self.offset_y = 0
 
     def update(self, is_shaking):
         if is_shaking:
             # Generate a random vibration
-            self.offset_x = random.randint(-10, 10)
-            self.offset_y = random.randint(-10, 10)
+            self.shake_x = random.randint(-10, 10)
+            self.shake_y = random.randint(-10, 10)
         else:
-            self.offset_x = 0
-            self.offset_y = 0
+            self.shake_x = 0
+            self.shake_y = 0
+        self._refresh()
+
+    def follow(self, rect, level_size):
+        """Centres on rect, but never scrolls past the level edges."""
+        self.scroll_x = self._clamp(rect.centerx - self.view_w // 2, level_size[0] - self.view_w)
+        self.scroll_y = self._clamp(rect.centery - self.view_h // 2, level_size[1] - self.view_h)
+        self._refresh()
+
+    def _clamp(self, pos, max_pos):
+        # A level smaller than the window just sits in the middle
+        if max_pos <= 0: return max_pos // 2
+        return max(0, min(pos, max_pos))
+
+    def _refresh(self):
+        self.offset_x = self.shake_x - self.scroll_x
+        self.offset_y = self.shake_y - self.scroll_y
+
+    def view_rect(self, margin=10):
+        """The part of the level that's on screen (in level coordinates)."""
+        return pygame.Rect(self.scroll_x - margin, self.scroll_y - margin,
+                           self.view_w + 2 * margin, self.view_h + 2 * margin)
 
     def apply(self, rect):
         """Returns a new rect moved by the camera offset."""
@@ -148,227 +142,171 @@ restart_button = pygame.Rect(WIDTH//2 - 110, HEIGHT//2 + 40, 220, 55)
 quit_button = pygame.Rect(WIDTH//2 - 110, HEIGHT//2 + 110, 220, 55)
 
 
-class Player:
-    def __init__(self, pos):
-        self.image = player_walk_right[0]
-        self.rect = self.image.get_rect(topleft=pos)
-        self.spawn_pos = pos
-        self.speed = 4
-        self.health = MAX_HEALTH
-        self.is_hidden = False
-        self.facing_right = True
-
-        self.frame_index = 0.0
-        self.anim_speed = 0.15
-
-    def update(self, walls, bushes):
-        keys = pygame.key.get_pressed()
-        dx = dy = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]: 
-            dx = -self.speed
-            self.facing_right = True
-
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            dx = self.speed
-            self.facing_right = False
-
-        if keys[pygame.K_UP] or keys[pygame.K_w]: 
-            dy = -self.speed
-
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]: 
-            dy = self.speed
-        
-
-        # Horizontal collision
-        self.rect.x += dx
-        for w in walls:
-            if self.rect.colliderect(w):
-                if dx > 0: self.rect.right = w.left
-                if dx < 0: self.rect.left = w.right
-
-
-        # Vertical collision
-        self.rect.y += dy
-        for w in walls:
-            if self.rect.colliderect(w):
-                if dy > 0: self.rect.bottom = w.top
-                if dy < 0: self.rect.top = w.bottom
-
-        if dx != 0 or dy != 0:
-            self.frame_index += self.anim_speed
-        else:
-            self.frame_index = 0
-
-        if self.frame_index >= len(player_walk_right):
-            self.frame_index = 0
-
-        self.is_hidden = any(b.collidepoint(self.rect.center) for b in bushes)
-
-class Monster:
-    def __init__(self, pos, speed, image):
-        self.image = image
-        self.rect = image.get_rect(topleft=pos)
-        self.speed = speed
-        self.dir = random.choice([(1,0), (-1,0), (0,1), (0,-1)])
-        self.timer = 0
-
-    def update(self, player, walls):
-        if not player.is_hidden:
-            dx = 1 if player.rect.x > self.rect.x else -1
-            dy = 1 if player.rect.y > self.rect.y else -1
-        else:
-            if self.timer <= 0:
-                self.dir = random.choice([(1,0), (-1,0), (0,1), (0,-1)])
-                self.timer = random.randint(40, 100)
-            self.timer -= 1.5
-            dx, dy = self.dir
-
-
-        self.move(dx * self.speed, dy * self.speed, walls)
-
-    def move(self, dx, dy, walls):
-        self.rect.x += dx
-        for w in walls:
-            if self.rect.colliderect(w): self.rect.x -= dx
-        self.rect.y += dy
-        for w in walls:
-            if self.rect.colliderect(w): self.rect.y -= dy
-
-class Firework:
-    def __init__(self):
-        self.x = random.randint(100, WIDTH - 100)
-        self.y = random.randint(50, HEIGHT // 2)
-        self.particles = []
-
-        for _ in range(60):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            self.particles.append([
-                self.x,
-                self.y,
-                math.cos(angle) * speed,
-                math.sin(angle) * speed,
-                random.randint(40, 60)
-            ])
-
-    def update(self):
-        for p in self.particles:
-            p[0] += p[2]
-            p[1] += p[3]
-            p[4] -= 1
-
-    def draw(self, surf):
-        for x, y, _, _, life in self.particles:
-            if life > 0:
-                pygame.draw.circle(surf, GOLD, (int(x), int(y)), 3)
+def launch_firework(particles):
+    """One burst of 60 gold particles somewhere in the top half of the sky."""
+    x = random.randint(100, WIDTH - 100)
+    y = random.randint(50, HEIGHT // 2)
+    particles.burst(x, y, 60, speed=(2, 6), life=(40, 60), color=GOLD)
 
 
 # ---------------- 4. HELPERS ----------------
+HEALTH_BAR_RECT = pygame.Rect(40, 10, 200, 20)
+
 def draw_ui(surf, health):
     # Health Bar
-    pygame.draw.rect(surf, RED, (40, 10, 200, 20))
+    pygame.draw.rect(surf, RED, HEALTH_BAR_RECT)
     pygame.draw.rect(surf, GREEN, (40, 10, int((health/MAX_HEALTH)*200), 20))
-    pygame.draw.rect(surf, WHITE, (40, 10, 200, 20), 2)
-
-def get_level_data(level_map, level_idx):
-    walls, bushes, coins, floors = [], [], [], []
-    for y, row in enumerate(level_map):
-        for x, char in enumerate(row):
-            r = pygame.Rect(x*TILE_SIZE, y*TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            if char == '#': walls.append(r)
-            else:
-                floors.append(r)
-                if char == 'B': bushes.append(r)
-                elif char == '.' and random.random() < 0.05: # 5% chance for coin
-                    coin_rect = coin_img.get_rect(center=r.center)
-                    coins.append(coin_rect) # create coins
+    pygame.draw.rect(surf, WHITE, HEALTH_BAR_RECT, 2)
+    return HEALTH_BAR_RECT
+
+def interpolate(entity, alpha):
+    """Rect of an entity blended between its previous and current tick position."""
+    px, py = entity.prev_pos
+    x = px + (entity.rect.x - px) * alpha
+    y = py + (entity.rect.y - py) * alpha
+    return pygame.Rect(round(x), round(y), entity.rect.width, entity.rect.height)
+
+def read_keys():
+    """Turns the keyboard state into the simulation's input bitmask."""
+    keys = pygame.key.get_pressed()
+    mask = 0
+    if keys[pygame.K_LEFT] or keys[pygame.K_a]: mask |= LEFT
+    if keys[pygame.K_RIGHT] or keys[pygame.K_d]: mask |= RIGHT
+    if keys[pygame.K_UP] or keys[pygame.K_w]: mask |= UP
+    if keys[pygame.K_DOWN] or keys[pygame.K_s]: mask |= DOWN
+    return mask
+
+recorder = None
+
+def new_game():
+    """A fresh GameScene, played by the bot with AUTOPILOT and recorded to RECORD_DIR."""
+    global recorder
+    seed = random.randrange(2**32)
+    game = GameScene(seed)
+    if AUTOPILOT: game.read_input = Bot(game.sim)
+    if RECORD_DIR:
+        if recorder: recorder.close()
+        path = os.path.join(RECORD_DIR, time.strftime("%Y%m%d-%H%M%S") + f"-{seed}.replay")
+        recorder = game.read_input = InputRecorder(path, seed, game.read_input)
+    return game
+
+def end_animation(next_scene=None):
+    # One packed file from add_video.py if it's there, the PNG frames otherwise
+    if os.path.exists("video/end.pack"):
+        source = FramePack("video/end.pack")
+    else:
+        frame_folder = "video/end_frames"
+        source = PngFrames([os.path.join(frame_folder, f) for f in sorted(os.listdir(frame_folder))])
+
+    # Frames are decoded on a background thread while playing, a few at a time
+    return VideoScene(source, 24, scary_sound, next_scene)  # video FPS
+
+
+# ---------------- 5. SCENES ----------------
+# Everything runs in the one SceneManager loop; static screens sleep in
+# pygame.event.wait() until input arrives or they need to change.
+class MenuScene(Scene):
+    idle = True
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+            self.manager.switch(LevelScene(new_game()))
+
+    def draw(self, screen):
+        screen.blit(menu_bg, (0, 0))
+        text = render_text("PRESS SPACE TO BEGIN", 45, WHITE)
+        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT - 80))
+        if pygame.time.get_ticks() % 1000 < 500: screen.blit(text, text_rect)
 
-    
-    spawn = random.choice(bushes).topleft if bushes else (40, 40)
-    return walls, bushes, coins, floors, spawn
+    def wake_in(self):
+        # Only to blink the text
+        return 500 - pygame.time.get_ticks() % 500
 
-def level_screen(level_number):
-    start_time = pygame.time.get_ticks()
 
-    while pygame.time.get_ticks() - start_time < 2000:
-        clock.tick(60)
-        screen.fill((0, 0, 0))
+class LevelScene(Scene):
+    """Shows "LEVEL n" for two seconds, then carries on with the game."""
+    idle = True
+
+    def __init__(self, game):
+        self.game = game
+
+    def enter(self):
+        self.start_time = pygame.time.get_ticks()
 
-        font = pygame.font.SysFont(None, 70)
-        text = font.render(f"LEVEL {level_number}", True, WHITE)
+    def update(self, dt):
+        if pygame.time.get_ticks() - self.start_time >= 2000:
+            self.manager.switch(self.game)
+
+    def draw(self, screen):
+        screen.fill((0, 0, 0))
+        text = render_text(f"LEVEL {self.game.sim.level_idx + 1}", 70, WHITE)
         screen.blit(text, text.get_rect(center=(WIDTH//2, HEIGHT//2)))
 
-        pygame.display.flip()
+    def wake_in(self):
+        return 2000 - (pygame.time.get_ticks() - self.start_time)
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
 
+class GameOverScene(Scene):
+    idle = True
 
-def game_over_screen():
-    while True:
+    def enter(self):
         pygame.mixer.music.stop()
-        clock.tick(60)
-        screen.fill((0, 0, 0))
 
-        font_big = pygame.font.SysFont(None, 80)
-        font_small = pygame.font.SysFont(None, 36)
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if restart_button.collidepoint(event.pos):
+                self.manager.switch(MenuScene())
+            if quit_button.collidepoint(event.pos):
+                self.manager.quit()
+
+    def draw(self, screen):
+        screen.fill((0, 0, 0))
 
-        title = font_big.render("GAME OVER", True, RED)
+        title = render_text("GAME OVER", 80, RED)
         screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//2 - 80)))
 
         pygame.draw.rect(screen, GREEN, restart_button, border_radius=10)
         pygame.draw.rect(screen, RED, quit_button, border_radius=10)
 
-        screen.blit(font_small.render("RESTART", True, WHITE),
+        screen.blit(render_text("RESTART", 36, WHITE),
                     restart_button.move(60, 15))
-        screen.blit(font_small.render("QUIT", True, WHITE),
+        screen.blit(render_text("QUIT", 36, WHITE),
                     quit_button.move(80, 15))
 
-        pygame.display.flip()
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+class GameCompleteScene(Scene):
+    fps = 60
 
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if restart_button.collidepoint(event.pos):
-                    return "restart"
-                if quit_button.collidepoint(event.pos):
-                    pygame.quit()
-                    sys.exit()
+    def enter(self):
+        lvl_1_music.stop()
+        victory_music.play()
 
+        self.particles = ParticleSystem()
+        self.spawn_timer = 0
 
-def game_complete_screen():
-    lvl_1_music.stop()
-    victory_music.play()
-
-    fireworks = []
-    spawn_timer = 0
-
-    while True:
-        clock.tick(60)
-        screen.fill((10, 10, 30))
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if restart_button.collidepoint(event.pos):
+                pygame.mixer.music.stop()
+                self.manager.switch(MenuScene())
+            if quit_button.collidepoint(event.pos):
+                self.manager.quit()
 
-        spawn_timer += 1
-        if spawn_timer > 25:
-            fireworks.append(Firework())
-            spawn_timer = 0
+    def update(self, dt):
+        self.spawn_timer += 1
+        if self.spawn_timer > 25:
+            launch_firework(self.particles)
+            self.spawn_timer = 0
 
-        for fw in fireworks[:]:
-            fw.update()
-            fw.draw(screen)
-            if all(p[4] <= 0 for p in fw.particles):
-                fireworks.remove(fw)
+        # All fireworks live in one particle system, dead sparks drop out in update()
+        self.particles.update()
 
-        font_big = pygame.font.SysFont(None, 60)
-        font_mid = pygame.font.SysFont(None, 45)
-        font_small = pygame.font.SysFont(None, 36)
+    def draw(self, screen):
+        screen.fill((10, 10, 30))
+        self.particles.draw(screen)
 
-        title = font_big.render("CONGRATULATIONS", True, GOLD)
-        subtitle = font_mid.render("YOU SURVIVED THE FOREST!", True, WHITE)
+        title = render_text("CONGRATULATIONS", 60, GOLD)
+        subtitle = render_text("YOU SURVIVED THE FOREST!", 45, WHITE)
 
         screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//2 - 120)))
         screen.blit(subtitle, subtitle.get_rect(center=(WIDTH//2, HEIGHT//2 - 50)))
@@ -376,193 +314,125 @@ def game_complete_screen():
         pygame.draw.rect(screen, GREEN, restart_button, border_radius=12)
         pygame.draw.rect(screen, RED, quit_button, border_radius=12)
 
-        screen.blit(font_small.render("PLAY AGAIN", True, WHITE),
+        screen.blit(render_text("PLAY AGAIN", 36, WHITE),
                     restart_button.move(40, 15))
-        screen.blit(font_small.render("QUIT", True, WHITE),
+        screen.blit(render_text("QUIT", 36, WHITE),
                     quit_button.move(80, 15))
 
-        pygame.display.flip()
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if restart_button.collidepoint(event.pos):
-                    pygame.mixer.music.stop()
-                    return "restart"
-                if quit_button.collidepoint(event.pos):
-                    pygame.quit()
-                    sys.exit()
-
-# ---------- VIDEO (FRAME-BASED) ----------
-def play_end_animation():
-    frame_folder = "video/end_frames"
-    frames = []
-
-    for f in sorted(os.listdir(frame_folder)):
-        img = pygame.image.load(os.path.join(frame_folder, f)).convert()
-        img = pygame.transform.scale(img, (WIDTH, HEIGHT))
-        frames.append(img)
-
-    scary_sound.play()
-
-    for frame in frames:
-        for e in pygame.event.get():
-            if e.type == pygame.QUIT:
-                pygame.quit()
-                exit()
-
-        screen.blit(frame, (0, 0))
-        pygame.display.flip()
-        clock.tick(24)  # video FPS
-
-# ---------------- 5. MAIN LOOP ----------------
-def main_game():
-    level_idx = 0
-    player = None
-    camera = Camera()
-
-    while level_idx < len(LEVELS):
-        level_screen(level_idx + 1)
+
+class GameScene(Scene):
+    """The levels themselves: fixed-timestep simulation, interpolated drawing."""
+    fps = RENDER_FPS
+
+    def __init__(self, seed=None, read_input=read_keys):
+        self.sim = Simulation(seed, profiler=profiler)
+        self.read_input = read_input  # keyboard, or a script / bot / replay
+        self.camera = Camera()
+        self.renderer = None
+
+    def enter(self):
+        # Called at the start of every level (after its LevelScene)
+        sim = self.sim
         lvl_1_music.play(-1)
-        
-        walls, bushes, coins, floors, spawn = get_level_data(LEVELS[level_idx], level_idx)
 
-        total_coins = len(coins)
-        health_pack_spawned = False
-        health_pack = None
-        
-        if not player: player = Player(spawn)
-        else: player.rect.topleft = spawn; player.health = MAX_HEALTH
+        # Static level drawn from cached chunks, only the ones on screen
+        self.chunks = ChunkRenderer(sim.level_map, TILE_SIZE, FLOOR_COLOR, WALL_COLOR, bush_img)
+        if not self.renderer: self.renderer = LevelRenderer(screen, self.chunks, DIRTY_RECTS)
+        else: self.renderer.set_level(self.chunks)
 
         # Ghost image per level
-        ghost_img = pygame.image.load(
-            os.path.join("img", f"ghost{level_idx + 1}.png")
-        ).convert_alpha()
-        ghost_img = pygame.transform.scale(ghost_img, (30, 30))
-
-        # Create monsters
-        monsters = [
-            Monster(
-                random.choice(floors).topleft, 
-                2.0 + (level_idx * 0.8),
-                ghost_img
-            ) 
-            for _ in range(level_idx + 3)
-        ]
-        
-        level_running = True
-        while level_active := level_running:
-            clock.tick(FPS)
-            is_touching_monster = False
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-
-            # Logic
-            player.update(walls, bushes)
-            for m in monsters:
-                m.update(player, walls)
-                if m.rect.colliderect(player.rect) and not player.is_hidden:
-                    collision_sound.play()
-                    player.health -= 0.5 # Damage
-                    is_touching_monster = True # Trigger Shake
-                
-            # Camera Update
-            camera.update(is_touching_monster)
+        self.ghost_img = load_image(os.path.join("img", f"ghost{sim.level_idx + 1}.png"), (30, 30))
+        self.accumulator = 0.0
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F2:
+            self.renderer.toggle()
+
+    def update(self, dt):
+        # Render as often as RENDER_FPS allows, simulate at a fixed FPS
+        sim = self.sim
+        self.accumulator += min(dt, MAX_FRAME_TIME)
+
+        while self.accumulator >= SIM_STEP:
+            self.accumulator -= SIM_STEP
+
+            # Logic (one fixed simulation tick)
+            events = sim.step(self.read_input())
+            if "hit" in events: collision_sound.play()
+            if "coin" in events: coin_sound.play()
+
+            # Camera Update (shake while a ghost touches us)
+            self.camera.update("hit" in events)
 
             # Dead
-            if player.health <= 0: 
+            if "dead" in events:
                 lvl_1_music.stop()
-                # play_end_animation()
-                choice = game_over_screen()
-                if choice == "restart":
-                    return  # Exit main_game() and restart from menu
-                 
-            # Complete Game
-            for c in coins[:]:
-                if player.rect.colliderect(c): 
-                    coin_sound.play()
-                    coins.remove(c)
-
-                    # Spawn health pack at half coins
-                    if (not health_pack_spawned 
-                        and len(coins) <= total_coins // 2):
-
-                        spawn_tile = random.choice(floors)
-                        health_pack = pygame.Rect(
-                            spawn_tile.centerx - 15,
-                            spawn_tile.centery - 15,
-                            30,
-                            30
-                        )
-                        health_pack_spawned = True
-            
-            # Health pack collection
-            if health_pack and player.rect.colliderect(health_pack):
-                increase = player.health * 0.8
-                player.health = min(player.health + increase, MAX_HEALTH)
-                health_pack = None  # remove it
-
-
-            if not coins:
-                level_running = False
+                # self.manager.switch(end_animation(GameOverScene()))
+                self.manager.switch(GameOverScene())
+                return
+
+            if "cleared" in events:
                 lvl_1_music.stop()
                 # LAST LEVEL COMPLETED
-                if level_idx == len(LEVELS) - 1:
-                    choice = game_complete_screen()
-                    if choice == "restart":
-                        return   # back to main menu
+                if sim.is_last_level():
+                    self.manager.switch(GameCompleteScene())
                 else:
-                    level_idx += 1
+                    sim.start_level(sim.level_idx + 1)
+                    self.manager.switch(LevelScene(self))
+                return
 
-                
+    def draw(self, screen):
+        sim, camera, renderer = self.sim, self.camera, self.renderer
+        player = sim.player
 
-            # Drawing
-            screen.fill((10, 10, 10))
-            
-            # Draw everything with camera.apply()
-            for f in floors: pygame.draw.rect(screen, FLOOR_COLOR, camera.apply(f))
-            for w in walls: pygame.draw.rect(screen, WALL_COLOR, camera.apply(w))
-            for b in bushes: screen.blit(bush_img, camera.apply(b))
-            # for c in coins: pygame.draw.circle(screen, GOLD, camera.apply(c).center, 6)
-            for c in coins: screen.blit(coin_img, camera.apply(c))
-            for m in monsters: screen.blit(m.image, camera.apply(m.rect))
+        # How far we are between the last two ticks, for smooth movement
+        alpha = self.accumulator / SIM_STEP
 
-            if health_pack:
-                screen.blit(health_pack_img, camera.apply(health_pack))
+        p_rect = interpolate(player, alpha)
+        camera.follow(p_rect, self.chunks.size)
 
-            
-            # Draw player (with hiding effect)
-            p_rect_shaken = camera.apply(player.rect)
+        # Static level from the chunks, dynamic stuff on top with camera.apply()
+        renderer.begin((camera.offset_x, camera.offset_y))
 
-            # Choose player image based on facing direction
-            p_img = player_walk_right[int(player.frame_index)] if player.facing_right else player_walk_left[int(player.frame_index)]
-            p_img = p_img.copy()
+        # Only what's on screen, straight from the spatial hash
+        visible = sim.entities.query(camera.view_rect(margin=TILE_SIZE))
+        # for c in coins: pygame.draw.circle(screen, GOLD, camera.apply(c).center, 6)
+        for key in visible:
+            if key in sim.coins: renderer.blit(coin_img, camera.apply(sim.coins[key]))
+        for key in visible:
+            if isinstance(key, Monster): renderer.blit(self.ghost_img, camera.apply(interpolate(key, alpha)))
 
-            if player.is_hidden: 
-                p_img.set_alpha(128)
+        if sim.health_pack:
+            renderer.blit(health_pack_img, camera.apply(sim.health_pack))
 
-            screen.blit(p_img, p_rect_shaken)
+        # Draw player (with hiding effect)
+        p_rect_shaken = camera.apply(p_rect)
 
-            draw_ui(screen, player.health)
-            pygame.display.flip()
+        # Choose player image based on facing direction and hiding
+        p_img = player_sprites[player.facing_right, player.is_hidden][int(player.frame_index)]
+        renderer.blit(p_img, p_rect_shaken)
 
-def main_menu():
-    while True:
-        screen.blit(menu_bg, (0, 0))
-        font = pygame.font.SysFont(None, 45)
-        text = font.render("PRESS SPACE TO BEGIN", True, WHITE)
-        text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT - 80))
-        if pygame.time.get_ticks() % 1000 < 500: screen.blit(text, text_rect)
-        pygame.display.flip()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT: pygame.quit(); sys.exit()
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                main_game()
+        renderer.mark(draw_ui(screen, player.health))
+
+    def present(self):
+        self.renderer.present()
+
+    def mark_dirty(self, rect):
+        self.renderer.mark(rect)
 
 
 if __name__ == "__main__":
-    main_menu()
\ No newline at end of file
+    first = MenuScene()
+    AUTOPILOT = "--bot" in sys.argv
+    if "--record" in sys.argv:
+        RECORD_DIR = sys.argv[sys.argv.index("--record") + 1]
+        os.makedirs(RECORD_DIR, exist_ok=True)
+    if "--replay" in sys.argv:
+        # Watch a recording (python replay.py re-runs one without a window)
+        seed, crc, runs = read_replay(sys.argv[sys.argv.index("--replay") + 1])
+        first = LevelScene(GameScene(seed, ReplayInput(runs)))
+    try:
+        SceneManager(screen, clock, profiler).run(first)
+    finally:
+        if recorder: recorder.close()  # also keeps what led up to a crash
+    pygame.quit()
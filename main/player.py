@@ -5,10 +5,17 @@ import player
 
 player_walk_right = []
 player_walk_left = []
+player_walk_right_hidden = []
+player_walk_left_hidden = []
 bush_img = None
 
+def translucent(img, alpha):
+    img = img.copy()
+    img.set_alpha(alpha)
+    return img
+
 def load_assets(tile_size=TILE_SIZE):
-    global player_walk_right, player_walk_left, bush_img
+    global player_walk_right, player_walk_left, player_walk_right_hidden, player_walk_left_hidden, bush_img
     # Load walking frames
     player_walk_right = [
         pygame.image.load(os.path.join("img", f"player_walk_{i}.png")).convert_alpha()
@@ -16,6 +23,9 @@ def load_assets(tile_size=TILE_SIZE):
     ]
     player_walk_right = [pygame.transform.scale(img, (tile_size-10, tile_size-10)) for img in player_walk_right]
     player_walk_left = [pygame.transform.flip(img, True, False) for img in player_walk_right]
+    # See-through versions for hiding in bushes, made once here instead of every frame
+    player_walk_right_hidden = [translucent(img, 120) for img in player_walk_right]
+    player_walk_left_hidden = [translucent(img, 120) for img in player_walk_left]
 
     # Load bush
     bush_img = pygame.image.load(os.path.join("img", "bush.png")).convert_alpha()
@@ -38,6 +48,9 @@ class Player:
         # Animation
         self.walk_frames_right = player_walk_right
         self.walk_frames_left = player_walk_left
+        self.hidden_frames_right = player_walk_right_hidden
+        self.hidden_frames_left = player_walk_left_hidden
+        self.hidden_image = self.hidden_frames_right[0]
         self.frame_index = 0
         self.animation_speed = 0.15
 
@@ -67,8 +80,10 @@ class Player:
             if self.frame_index >= len(self.walk_frames_right):
                 self.frame_index = 0
             self.image = self.walk_frames_right[int(self.frame_index)] if self.facing_right else self.walk_frames_left[int(self.frame_index)]
+            self.hidden_image = self.hidden_frames_right[int(self.frame_index)] if self.facing_right else self.hidden_frames_left[int(self.frame_index)]
         else:
             self.image = self.walk_frames_right[0] if self.facing_right else self.walk_frames_left[0]
+            self.hidden_image = self.hidden_frames_right[0] if self.facing_right else self.hidden_frames_left[0]
 
     def move(self, dx, dy, walls):
         self.hitbox.x += dx
@@ -86,9 +101,4 @@ class Player:
         self.rect.center = self.hitbox.center 
 
     def draw(self, surf):
-        if self.hidden:
-            img = self.image.copy()
-            img.set_alpha(120)
-            surf.blit(img, self.rect)
-        else:
-            surf.blit(self.image, self.rect)
+        surf.blit(self.hidden_image if self.hidden else self.image, self.rect)
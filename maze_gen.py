@@ -0,0 +1,125 @@
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Same characters as the hand-made LEVELS in settings.py
+WALL = ord('#')
+FLOOR = ord('.')
+BUSH = ord('B')
+
+
+def generate_level(width, height, seed=None, loop_chance=0.15, bush_density=0.04, bush_cluster=2):
+    """Random maze as a list of strings in the LEVELS format ('#', '.', 'B').
+
+    A depth-first maze is carved on the odd cells, then `loop_chance` of the
+    remaining inner walls are knocked out so there's more than one way
+    around a ghost. Bushes are dropped as bush_cluster x bush_cluster patches
+    until roughly `bush_density` of the floor is covered.
+    """
+    rng = random.Random(seed)
+    width = max(5, width)
+    height = max(5, height)
+    cells = bytearray([WALL]) * (width * height)
+
+    # Carve: iterative backtracker over the odd (x, y) positions
+    cols, rows = (width - 1) // 2, (height - 1) // 2
+    visited = bytearray(cols * rows)
+    stack = [(rng.randrange(cols), rng.randrange(rows))]
+    visited[stack[0][1] * cols + stack[0][0]] = 1
+    cells[(2 * stack[0][1] + 1) * width + 2 * stack[0][0] + 1] = FLOOR
+    steps = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    while stack:
+        cx, cy = stack[-1]
+        options = [
+            (cx + dx, cy + dy, dx, dy) for dx, dy in steps
+            if 0 <= cx + dx < cols and 0 <= cy + dy < rows and not visited[(cy + dy) * cols + cx + dx]
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny, dx, dy = rng.choice(options)
+        visited[ny * cols + nx] = 1
+        x, y = 2 * cx + 1, 2 * cy + 1
+        cells[(y + dy) * width + x + dx] = FLOOR
+        cells[(y + 2 * dy) * width + x + 2 * dx] = FLOOR
+        stack.append((nx, ny))
+
+    # Loops: open inner walls that sit between two floor tiles
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            i = y * width + x
+            if cells[i] != WALL or rng.random() >= loop_chance:
+                continue
+            if (cells[i - 1] == FLOOR and cells[i + 1] == FLOOR) or \
+               (cells[i - width] == FLOOR and cells[i + width] == FLOOR):
+                cells[i] = FLOOR
+
+    # Bushes, in small patches like the hand-made maps
+    floor_tiles = cells.count(FLOOR)
+    target = int(floor_tiles * bush_density)
+    placed = attempts = 0
+    while placed < target and attempts < target * 20:
+        attempts += 1
+        x = rng.randrange(1, width - 1)
+        y = rng.randrange(1, height - 1)
+        for py in range(y, min(y + bush_cluster, height - 1)):
+            for px in range(x, min(x + bush_cluster, width - 1)):
+                if cells[py * width + px] == FLOOR:
+                    cells[py * width + px] = BUSH
+                    placed += 1
+
+    return [cells[y * width:(y + 1) * width].decode() for y in range(height)]
+
+
+class LevelPrefetcher:
+    """Builds the next level in a worker process while the current one is played."""
+
+    def __init__(self, width, height, seed=0, **options):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.options = options
+        self.pool = ProcessPoolExecutor(max_workers=1)
+        self.pending = {}
+
+    def prefetch(self, index):
+        if index not in self.pending:
+            self.pending[index] = self.pool.submit(
+                generate_level, self.width, self.height, self.seed + index, **self.options)
+
+    def get(self, index):
+        """The level for index, waiting for it only if it isn't done yet."""
+        self.prefetch(index)
+        return self.pending.pop(index).result()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+def benchmark(sizes=(29, 50, 100, 200, 300), repeat=3):
+    """Generation time (best of `repeat`, ms) per square map size."""
+    results = []
+    for size in sizes:
+        best = min(_timed(size, seed) for seed in range(repeat))
+        results.append((size, best * 1000))
+    return results
+
+
+def _timed(size, seed):
+    start = time.perf_counter()
+    generate_level(size, size, seed)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    # python maze_gen.py --bench      -> generation time vs map size
+    # python maze_gen.py 41 21 [seed] -> print one level
+    if "--bench" in sys.argv:
+        print(f"{'size':>9}  {'tiles':>7}  {'ms':>8}")
+        for size, ms in benchmark():
+            print(f"{size:>4}x{size:<4}  {size * size:>7}  {ms:>8.1f}")
+    else:
+        w, h = (int(a) for a in sys.argv[1:3]) if len(sys.argv) > 2 else (29, 15)
+        seed = int(sys.argv[3]) if len(sys.argv) > 3 else None
+        print("\n".join(generate_level(w, h, seed)))
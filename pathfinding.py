@@ -0,0 +1,84 @@
+from collections import deque
+
+STEPS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+
+class FlowField:
+    """Shared BFS flow field towards one target tile (the player).
+
+    One BFS runs whenever the target changes tile. After that every ghost
+    reads its next step with a single lookup, however many ghosts there are.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.target = None
+        size = grid.cols * grid.rows
+        self.dist = [-1] * size
+        self.next_step = [(0, 0)] * size
+        self.search = None  # BFS in progress, see update()
+        self.left = None
+
+    def update(self, tx, ty, budget=None):
+        """Recomputes the field if the target moved to another tile.
+
+        With a budget the BFS expands at most that many tiles per call and
+        carries on in the next one; until it is done the previous field stays
+        in use. Returns True when a new field is ready.
+        """
+        if self.search is None:
+            if (tx, ty) == self.target:
+                return False
+            self.search = self._search(tx, ty)
+        self.left = budget
+        try:
+            next(self.search)
+        except StopIteration:
+            self.search = None
+            return True
+        return False
+
+    def _search(self, tx, ty):
+        grid = self.grid
+        cols = grid.cols
+        cells = grid.cells
+        dist = [-1] * len(cells)
+        next_step = [(0, 0)] * len(cells)
+
+        if not grid.is_wall(tx, ty):
+            dist[ty * cols + tx] = 0
+            queue = deque([(tx, ty)])
+            while queue:
+                x, y = queue.popleft()
+                d = dist[y * cols + x] + 1
+                for sx, sy in STEPS:
+                    nx, ny = x + sx, y + sy
+                    if not (0 <= nx < cols and 0 <= ny < grid.rows):
+                        continue
+                    i = ny * cols + nx
+                    if cells[i] or dist[i] != -1:
+                        continue
+                    dist[i] = d
+                    # From the neighbour, walking back towards (x, y) gets closer
+                    next_step[i] = (-sx, -sy)
+                    queue.append((nx, ny))
+                if self.left is not None:
+                    self.left -= 1
+                    if self.left <= 0:
+                        yield
+
+        self.target = (tx, ty)
+        self.dist = dist
+        self.next_step = next_step
+
+    def direction(self, tx, ty):
+        """Step (dx, dy) towards the target, (0, 0) if there or unreachable."""
+        if 0 <= tx < self.grid.cols and 0 <= ty < self.grid.rows:
+            return self.next_step[ty * self.grid.cols + tx]
+        return (0, 0)
+
+    def distance(self, tx, ty):
+        """Number of tiles to the target, -1 if unreachable."""
+        if 0 <= tx < self.grid.cols and 0 <= ty < self.grid.rows:
+            return self.dist[ty * self.grid.cols + tx]
+        return -1
@@ -0,0 +1,110 @@
+import time
+from collections import deque
+
+import pygame
+
+from text import get_font
+
+# Order the phases are listed in on the overlay
+PHASES = ["events", "player", "ai", "monsters", "pickups", "update", "draw", "flip", "idle"]
+GRAPH_MS = 33.3  # frame time at the top of the graph
+BUDGET_MS = 1000 / 60
+
+
+class FrameProfiler:
+    """Rolling per-phase frame timings with an on-screen overlay (F3).
+
+    Code calls mark("phase") after each phase; the time since the previous
+    mark is charged to that phase. While disabled every call returns right
+    away, so the marks can stay in release builds.
+    """
+
+    def __init__(self, history=240):
+        self.enabled = False
+        self.frames = deque(maxlen=history)  # total ms per frame
+        self.phases = {}  # phase -> deque of ms per frame
+        self.current = {}
+        self.counters = {}  # name -> latest value, listed under the phases
+        self.last = 0.0
+        self.panel = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames.clear()
+        self.phases.clear()
+        self.counters.clear()
+        self.current = {}  # F3 comes mid-frame; don't carry that frame's partial marks over
+        self.last = time.perf_counter()
+
+    def mark(self, phase):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last) * 1000
+        self.last = now
+
+    def count(self, name, value):
+        """Shows a number for this frame on the overlay, e.g. work left queued."""
+        if self.enabled:
+            self.counters[name] = value
+
+    def end_frame(self):
+        """Closes the frame: everything since the last mark counts as 'idle'."""
+        if not self.enabled:
+            return
+        self.mark("idle")
+        self.frames.append(sum(self.current.values()))
+        for phase in set(self.phases) | set(self.current):
+            if phase not in self.phases:
+                self.phases[phase] = deque([0.0] * (len(self.frames) - 1), maxlen=self.frames.maxlen)
+            self.phases[phase].append(self.current.get(phase, 0.0))
+        self.current = {}
+
+    def percentiles(self, *ps):
+        """Frame time (ms) at the given percentiles over the history."""
+        if not self.frames:
+            return [0.0 for _ in ps]
+        ordered = sorted(self.frames)
+        return [ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] for p in ps]
+
+    def draw(self, surf):
+        """Draws the overlay in the top-right corner and returns its rect."""
+        if not self.enabled:
+            return None
+        w, h = 260, 260
+        if self.panel is None:
+            self.panel = pygame.Surface((w, h), pygame.SRCALPHA)
+        rect = pygame.Rect(surf.get_width() - w - 10, 10, w, h)
+        self.panel.fill((0, 0, 0, 170))
+
+        # Frame time graph, one column per frame, budget line at 60 FPS
+        graph_h = 60
+        n = len(self.frames)
+        for i, ms in enumerate(self.frames):
+            x = w - n + i
+            bar = min(graph_h, int(ms / GRAPH_MS * graph_h))
+            color = (0, 200, 0) if ms <= BUDGET_MS * 1.05 else (220, 60, 30)
+            pygame.draw.line(self.panel, color, (x, graph_h), (x, graph_h - bar))
+        budget_y = graph_h - int(BUDGET_MS / GRAPH_MS * graph_h)
+        pygame.draw.line(self.panel, (255, 255, 255), (0, budget_y), (w, budget_y))
+
+        font = get_font(None, 20)
+        p50, p95, p99 = self.percentiles(50, 95, 99)
+        lines = [f"frame p50 {p50:5.1f}  p95 {p95:5.1f}  p99 {p99:5.1f} ms"]
+        for phase in PHASES + sorted(set(self.phases) - set(PHASES)):
+            if phase in self.phases:
+                values = self.phases[phase]
+                lines.append(f"{phase:<9} avg {sum(values) / len(values):6.2f}  max {max(values):6.2f} ms")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<9} {value}")
+        y = graph_h + 6
+        for line in lines:
+            self.panel.blit(font.render(line, True, (255, 255, 255)), (6, y))
+            y += 17
+
+        surf.blit(self.panel, rect)
+        return rect
+
+
+# Shared disabled instance for code that isn't given a profiler
+NULL_PROFILER = FrameProfiler()
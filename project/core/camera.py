@@ -7,8 +7,19 @@ class Camera:
         self.zoom = 1.0
 
     def apply(self, screen, surface):
-        w, h = surface.get_size()
-        scaled = pygame.transform.scale(surface, (int(w*self.zoom), int(h*self.zoom)))
         ox = random.randint(-self.shake, self.shake)
         oy = random.randint(-self.shake, self.shake)
+
+        # No zoom: a single offset blit, nothing gets scaled
+        if abs(self.zoom - 1.0) < 0.005:
+            screen.blit(surface, (ox, oy))
+            return
+
+        # Zoomed: only scale the part of the surface that ends up on screen
+        w, h = surface.get_size()
+        sw, sh = screen.get_size()
+        vw = min(w, int(sw / self.zoom) + 1)
+        vh = min(h, int(sh / self.zoom) + 1)
+        view = surface.subsurface((0, 0, vw, vh))
+        scaled = pygame.transform.scale(view, (int(vw*self.zoom), int(vh*self.zoom)))
         screen.blit(scaled, (ox, oy))
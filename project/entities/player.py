@@ -4,6 +4,9 @@ from assets.images import player_img
 class Player:
     def __init__(self):
         self.image = player_img
+        # See-through version for hiding, made once instead of every frame
+        self.hidden_image = player_img.copy()
+        self.hidden_image.set_alpha(120)
         self.rect = self.image.get_rect(topleft=(80, 80))
         self.speed = 4
         self.hidden = False
@@ -28,7 +31,4 @@ class Player:
                 self.rect.y -= dy
 
     def draw(self, surf):
-        img = self.image.copy()
-        if self.hidden:
-            img.set_alpha(120)
-        surf.blit(img, self.rect)
+        surf.blit(self.hidden_image if self.hidden else self.image, self.rect)
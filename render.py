@@ -0,0 +1,64 @@
+import pygame
+
+BACKGROUND_COLOR = (10, 10, 10)
+
+
+class LevelRenderer:
+    """Draws one level frame, either as a full redraw + flip or with dirty rects.
+
+    In dirty mode only the rects that changed since the previous frame are
+    restored from the cached background and pushed with display.update().
+    Whenever the camera offset changes (scrolling or shaking) the whole
+    picture moves, so those frames fall back to a full flip.
+    """
+
+    def __init__(self, screen, chunks, dirty=False):
+        self.screen = screen
+        self.dirty = dirty
+        self.background = pygame.Surface(screen.get_size()).convert()
+        self.set_level(chunks)
+
+    def set_level(self, chunks):
+        self.chunks = chunks
+        self.offset = None
+        self.prev_rects = []
+        self.rects = []
+        self.full = True
+        self.force_full = True
+
+    def toggle(self):
+        self.dirty = not self.dirty
+        self.force_full = True
+
+    def begin(self, offset=(0, 0)):
+        """Clears the frame: restores old rects or redraws everything."""
+        moved = offset != self.offset
+        self.full = not self.dirty or moved or self.force_full
+        self.force_full = False
+
+        if moved:
+            # Repaint the cached background from the visible chunks
+            self.offset = offset
+            self.background.fill(BACKGROUND_COLOR)
+            self.chunks.draw(self.background, offset)
+
+        if self.full:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for r in self.prev_rects:
+                self.screen.blit(self.background, r, r)
+        self.rects = []
+
+    def blit(self, image, rect):
+        self.rects.append(self.screen.blit(image, rect))
+
+    def mark(self, rect):
+        """Registers something drawn directly on the screen (e.g. the UI)."""
+        self.rects.append(pygame.Rect(rect))
+
+    def present(self):
+        if self.full:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.prev_rects + self.rects)
+        self.prev_rects = self.rects
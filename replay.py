@@ -0,0 +1,155 @@
+"""Record a game session's input and play it back headless.
+
+python replay.py session.replay            -> re-runs it as fast as possible
+python replay.py session.replay --profile  -> also lists the slowest ticks
+
+The game records with `python main.py --record DIR`. A session is fully
+described by its seed plus the input bitmask of every simulation tick, so
+playing those back through a fresh Simulation reproduces it exactly.
+"""
+import struct
+import sys
+import time
+import zlib
+
+from settings import FPS, LEVELS
+
+# File layout (little endian):
+#   header  magic "RPLY", version, seed, crc32 of the level maps
+#   runs    (tick count, input bitmask) pairs, one per run of equal input
+MAGIC = b"RPLY"
+VERSION = 1
+HEADER = struct.Struct("<4sHQI")
+RUN = struct.Struct("<HB")
+MAX_RUN = 0xFFFF
+
+
+def levels_crc(levels=LEVELS):
+    """Recordings only replay correctly on the same maps."""
+    return zlib.crc32("\n".join("\n".join(level) for level in levels).encode())
+
+
+class InputRecorder:
+    """Wraps a read_input() for GameScene and logs every tick's input.
+
+    Runs of identical input are written as one (count, keys) pair, so a
+    minute of play is usually a few hundred bytes.
+    """
+
+    def __init__(self, path, seed, read_input, levels=LEVELS):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, levels_crc(levels)))
+        self.read_input = read_input
+        self.keys = None
+        self.count = 0
+
+    def __call__(self):
+        keys = self.read_input()
+        if keys != self.keys or self.count == MAX_RUN:
+            self._write_run()
+            self.keys = keys
+        self.count += 1
+        return keys
+
+    def _write_run(self):
+        if self.count:
+            self.file.write(RUN.pack(self.count, self.keys))
+        self.count = 0
+
+    def close(self):
+        if not self.file.closed:
+            self._write_run()
+            self.file.close()
+
+
+def read_replay(path):
+    """Returns (seed, levels crc, [(count, keys), ...]) from a recording."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version, seed, crc = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} replay")
+    runs = list(RUN.iter_unpack(data[HEADER.size:]))
+    return seed, crc, runs
+
+
+class ReplayInput:
+    """A read_input() that plays recorded runs back, then no keys at all."""
+
+    def __init__(self, runs):
+        self.runs = iter(runs)
+        self.keys = 0
+        self.left = 0
+
+    def __call__(self):
+        while not self.left:
+            self.left, self.keys = next(self.runs, (-1, 0))
+        self.left -= 1
+        return self.keys
+
+
+def replay(path, profile=False):
+    """Re-runs a recording through the headless simulation, without any pacing.
+
+    Level changes follow the same rules as GameScene. With profile=True every
+    tick is timed and the slowest ones are reported.
+    """
+    from profiler import FrameProfiler
+    from simulation import Simulation
+
+    seed, crc, runs = read_replay(path)
+    if crc != levels_crc():
+        print(f"warning: {path} was recorded on different level maps", file=sys.stderr)
+
+    ticks = sum(count for count, _ in runs)
+    prof = FrameProfiler(history=ticks)
+    if profile:
+        prof.toggle()
+    sim = Simulation(seed, profiler=prof)
+    read_input = ReplayInput(runs)
+    timings = []  # (ms, tick, level)
+    outcome = "stopped"
+
+    start = time.perf_counter()
+    for tick in range(ticks):
+        level = sim.level_idx
+        events = sim.step(read_input())
+        if profile:
+            prof.end_frame()
+            timings.append((prof.frames[-1], tick, level + 1))
+        if "dead" in events:
+            outcome = "dead"
+            break
+        if "cleared" in events:
+            if sim.is_last_level():
+                outcome = "complete"
+                break
+            sim.start_level(sim.level_idx + 1)
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "seed": seed,
+        "ticks": sim.ticks,
+        "recorded_ticks": ticks,
+        "outcome": outcome,
+        "level": sim.level_idx + 1,
+        "health": sim.player.health,
+        "seconds": round(elapsed, 3),
+        "speedup": round(sim.ticks / FPS / elapsed, 1) if elapsed else None,
+    }
+    if profile:
+        result["slowest"] = [
+            {"tick": t, "level": lvl, "ms": round(ms, 3)}
+            for ms, t, lvl in sorted(timings, reverse=True)[:10]
+        ]
+        result["phase_ms"] = {phase: round(sum(v) / len(v), 4) for phase, v in prof.phases.items()}
+    return result
+
+
+if __name__ == "__main__":
+    import json
+
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    print(json.dumps(replay(sys.argv[1], profile="--profile" in sys.argv), indent=2))
@@ -0,0 +1,107 @@
+import pygame
+
+from profiler import NULL_PROFILER
+from settings import FPS
+
+
+class Scene:
+    """One screen of the game (menu, level, game over ...).
+
+    The SceneManager calls update(), draw() and present() once per loop and
+    hands every event to handle_event(). Static screens set `idle` so the loop
+    sleeps in pygame.event.wait() instead of redrawing at full speed.
+    """
+
+    fps = FPS  # frame cap while this scene runs (0 = uncapped)
+    idle = False
+    manager = None
+
+    def enter(self):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self, screen):
+        pass
+
+    def present(self):
+        pygame.display.flip()
+
+    def mark_dirty(self, rect):
+        """Something (the profiler overlay) was drawn over the scene at rect."""
+        pass
+
+    def wake_in(self):
+        """For idle scenes: ms until the picture changes by itself (None = only on input)."""
+        return None
+
+
+class SceneManager:
+    """Runs the one main loop of the game and switches between scenes."""
+
+    def __init__(self, screen, clock, profiler=NULL_PROFILER):
+        self.screen = screen
+        self.clock = clock
+        self.profiler = profiler
+        self.scene = None
+        self.next_scene = None
+        self.running = False
+
+    def switch(self, scene):
+        """Takes effect at the start of the next loop."""
+        self.next_scene = scene
+
+    def quit(self):
+        self.running = False
+
+    def run(self, scene):
+        self.switch(scene)
+        self.running = True
+        dt = 0
+        prof = self.profiler
+        while self.running:
+            if self.next_scene:
+                self.scene, self.next_scene = self.next_scene, None
+                self.scene.manager = self
+                self.scene.enter()
+                self.clock.tick()
+                dt = 0
+            scene = self.scene
+
+            scene.update(dt)
+            prof.mark("update")
+            if self.next_scene or not self.running:
+                continue
+            scene.draw(self.screen)
+            if prof.enabled:
+                scene.mark_dirty(prof.draw(self.screen))
+            prof.mark("draw")
+            scene.present()
+            prof.mark("flip")
+
+            if scene.idle:
+                # Sleep until input arrives or the scene wants a redraw
+                timeout = scene.wake_in()
+                first = pygame.event.wait(max(1, timeout) if timeout is not None else 0)
+                events = [first] + pygame.event.get()
+                dt = self.clock.tick()
+                prof.mark("idle")
+            else:
+                dt = self.clock.tick(scene.fps)
+                prof.mark("idle")
+                events = pygame.event.get()
+
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.running = False
+                    break
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    prof.toggle()
+                    continue
+                scene.handle_event(event)
+            prof.mark("events")
+            prof.end_frame()
@@ -0,0 +1,63 @@
+# ---------- SETTINGS ----------
+TILE_SIZE = 40
+FPS = 60  # simulation ticks per second
+MAX_HEALTH = 100
+
+# YOUR ORIGINAL MAPS
+LEVELS = [
+    [
+        "#############################",
+        "#......##....##....##.......#",
+        "#.####..##..##..####..####..#",
+        "#..BB.....#.....BB......B...#",
+        "#..BB..#..#.#..BB..######...#",
+        "#......#....#......#........#",
+        "#####.......#.........####..#",
+        "#....###....#......#........#",
+        "#..BB..#..###..BB......BB.#.#",
+        "#..BB...........BB......BB..#",
+        "#.####..##..##..####..##..###",
+        "#......##...B##....##.......#",
+        "#..BB.......................#",
+        "#......#....#...B..#.....#.B#",
+        "#############################",
+    ],
+    [
+        "#############################",
+        "#..BB....#..#....BB....#..#.#",
+        "#..##....##.#....##....##...#",
+        "#......BB......BB......BB...#",
+        "####..######..######..####..#",
+        "#......#......#......#......#",
+        "#....###...######...##..##..#",
+        "#......BB..............BB..##",
+        "#..##....####....##....##.#.#",
+        "#..B........#....BB....#..#.#",
+        "#.......B...................#",
+        "####..######..######.B##....#",
+        "#......#....B.#......#...#..#",
+        "#..BB.....#........BB....#..#",
+        "#############################",
+    ],
+    [
+        "#############################",
+        "#....BB....#..#............##",
+        "#.##..#..#.#.#..###..###B...#",
+        "#.BB.....#...B..#....BB#....#",
+        "#.#....#.##.##.##.#.#..#....#",
+        "#.#..#..............#......##",
+        "#.......###....###..#....#..#",
+        "#.......BBB...............BB#",
+        "#..............BBB.........B#",
+        "#.#B.#..###....###..#.B#...##",
+        "#.#..#..............#..#....#",
+        "#.#..###.##B.#..#.###..#.#..#",
+        "#.B......#......#....BB#....#",
+        "#....#..#..##..B.#..#.#.....#",
+        "#############################",
+    ]
+]
+
+# Window size. Levels may be bigger, the camera scrolls to follow the player.
+WIDTH = len(LEVELS[0][0]) * TILE_SIZE
+HEIGHT = len(LEVELS[0]) * TILE_SIZE
@@ -0,0 +1,276 @@
+import random
+
+import pygame  # only for Rect, no display needed
+
+from ai_scheduler import AIScheduler
+from collision import TileGrid
+from pathfinding import FlowField
+from profiler import NULL_PROFILER
+from spatial_hash import SpatialHash
+from settings import *
+from visibility import for_level
+
+# Input bits for one tick
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+
+PLAYER_SIZE = TILE_SIZE - 10
+PLAYER_SPEED = 4
+GHOST_SIZE = 30
+COIN_SIZE = 30
+HEALTH_PACK_SIZE = 30
+WALK_FRAMES = 3
+DIRECTIONS = [(1,0), (-1,0), (0,1), (0,-1)]
+HEALTH_PACK = "health_pack"  # its key in Simulation.entities
+
+COIN_CHANCE = 0.05  # per '.' tile
+GHOST_DAMAGE = 0.5  # per touching ghost per tick
+HEAL_FACTOR = 0.8  # the health pack adds this share of the current health
+
+
+def ghost_count(level_idx):
+    return level_idx + 3
+
+def ghost_speed(level_idx):
+    return 2.0 + (level_idx * 0.8)
+
+
+class Player:
+    def __init__(self, pos):
+        self.rect = pygame.Rect(pos, (PLAYER_SIZE, PLAYER_SIZE))
+        self.spawn_pos = pos
+        self.prev_pos = pos
+        self.speed = PLAYER_SPEED
+        self.health = MAX_HEALTH
+        self.is_hidden = False
+        self.facing_right = True
+
+        self.frame_index = 0.0
+        self.anim_speed = 0.15
+
+    def respawn(self, pos):
+        self.rect.topleft = self.prev_pos = self.spawn_pos = pos
+        self.health = MAX_HEALTH
+
+    def update(self, keys, grid, bushes):
+        dx = dy = 0
+        if keys & LEFT:
+            dx = -self.speed
+            self.facing_right = True
+
+        if keys & RIGHT:
+            dx = self.speed
+            self.facing_right = False
+
+        if keys & UP:
+            dy = -self.speed
+
+        if keys & DOWN:
+            dy = self.speed
+
+        # Horizontal then vertical collision, only against nearby wall tiles
+        grid.slide(self.rect, dx, dy)
+
+        if dx != 0 or dy != 0:
+            self.frame_index += self.anim_speed
+        else:
+            self.frame_index = 0
+
+        if self.frame_index >= WALK_FRAMES:
+            self.frame_index = 0
+
+        self.is_hidden = any(b.collidepoint(self.rect.center) for b in bushes)
+
+class Monster:
+    def __init__(self, pos, speed, rng, tick=0):
+        self.rect = pygame.Rect(pos, (GHOST_SIZE, GHOST_SIZE))
+        self.prev_pos = pos
+        self.speed = speed
+        self.rng = rng
+        self.dir = rng.choice(DIRECTIONS)
+        self.timer = 0
+        self.target = None  # point it is chasing towards, None = wandering
+        self.thought = tick  # last tick it thought
+
+    def think(self, player, grid, flow, sight, elapsed=1):
+        """Decides where to go; `elapsed` ticks have passed since the last time."""
+        # Chase only a player it can see: not in a bush and no wall in between
+        here = grid.tile_at(*self.rect.center)
+        if not player.is_hidden and sight.visible(*here, *grid.tile_at(*player.rect.center)):
+            # Follow the shared flow field to the next tile, then aim for its centre
+            tx, ty = here
+            sx, sy = flow.direction(tx, ty)
+            if (sx, sy) == (0, 0):
+                self.target = player.rect.center
+            else:
+                self.target = grid.tile_rect(tx + sx, ty + sy).center
+            return
+
+        self.target = None
+        if self.timer <= 0:
+            self.dir = self.rng.choice(DIRECTIONS)
+            self.timer = self.rng.randint(40, 100)
+        self.timer -= 1.5 * elapsed
+
+    def move(self, grid):
+        """Moves one tick along the last decision."""
+        if self.target:
+            dx = max(-self.speed, min(self.speed, self.target[0] - self.rect.centerx))
+            dy = max(-self.speed, min(self.speed, self.target[1] - self.rect.centery))
+        else:
+            dx, dy = self.dir[0] * self.speed, self.dir[1] * self.speed
+        grid.step(self.rect, dx, dy)
+
+
+def get_level_data(level_map, rng=random, coin_chance=COIN_CHANCE):
+    walls, bushes, floors = [], [], []
+    coins = {}  # (tile x, tile y) -> rect
+    for y, row in enumerate(level_map):
+        for x, char in enumerate(row):
+            r = pygame.Rect(x*TILE_SIZE, y*TILE_SIZE, TILE_SIZE, TILE_SIZE)
+            if char == '#': walls.append(r)
+            else:
+                floors.append(r)
+                if char == 'B': bushes.append(r)
+                elif char == '.' and rng.random() < coin_chance:
+                    coin_rect = pygame.Rect(0, 0, COIN_SIZE, COIN_SIZE)
+                    coin_rect.center = r.center
+                    coins[x, y] = coin_rect # create coins
+
+    spawn = rng.choice(bushes).topleft if bushes else (40, 40)
+    grid = TileGrid(level_map, TILE_SIZE)
+    return walls, bushes, coins, floors, spawn, grid
+
+
+class Simulation:
+    """The whole game without a display: levels, player, ghosts, coins and health pack.
+
+    step() takes one input bitmask (LEFT | UP ...) per tick. All randomness
+    comes from the simulation's own seeded RNG, so the same seed and the same
+    inputs always play out the same way.
+
+    The difficulty can be overridden for balance sweeps: `ghosts` and
+    `ghost_speed` replace the per-level values for every level.
+
+    Ghosts move every tick, but when they decide where to go is up to the
+    AIScheduler (`scheduler`).
+    """
+
+    def __init__(self, seed=None, levels=LEVELS, profiler=NULL_PROFILER,
+                 ghosts=None, ghost_speed=None, coin_chance=COIN_CHANCE, heal_factor=HEAL_FACTOR,
+                 scheduler=None):
+        self.seed = seed
+        self.profiler = profiler
+        self.scheduler = scheduler or AIScheduler()
+        self.rng = random.Random(seed)
+        self.levels = levels
+        self.ghosts = ghosts
+        self.ghost_speed = ghost_speed
+        self.coin_chance = coin_chance
+        self.heal_factor = heal_factor
+        self.player = None
+        self.ticks = 0
+        self.start_level(0)
+
+    def start_level(self, level_idx):
+        self.level_idx = level_idx
+        self.level_map = self.levels[level_idx]
+        self.walls, self.bushes, self.coins, self.floors, spawn, self.grid = get_level_data(self.level_map, self.rng, self.coin_chance)
+        self.flow = FlowField(self.grid)
+        self.sight = for_level(self.level_map)  # ghosts' line of sight
+
+        self.total_coins = len(self.coins)
+        self.health_pack_spawned = False
+        self.health_pack = None
+
+        # Ghosts, coins and the health pack, bucketed by position for contact checks
+        self.entities = SpatialHash(TILE_SIZE * 2)
+        for tile, c in self.coins.items():
+            self.entities.insert(tile, c)
+
+        if not self.player: self.player = Player(spawn)
+        else: self.player.respawn(spawn)
+
+        count = ghost_count(level_idx) if self.ghosts is None else self.ghosts
+        speed = ghost_speed(level_idx) if self.ghost_speed is None else self.ghost_speed
+        self.monsters = [
+            Monster(
+                self.rng.choice(self.floors).topleft,
+                speed,
+                self.rng,
+                self.ticks
+            )
+            for _ in range(count)
+        ]
+        for m in self.monsters:
+            self.entities.insert(m, m.rect)
+
+    def is_last_level(self):
+        return self.level_idx == len(self.levels) - 1
+
+    def step(self, keys):
+        """Advances one tick and returns what happened.
+
+        The events are "hit" (once per touching ghost), "coin", "health",
+        "dead" and "cleared".
+        """
+        self.ticks += 1
+        events = []
+        player = self.player
+
+        player.prev_pos = player.rect.topleft
+        for m in self.monsters: m.prev_pos = m.rect.topleft
+
+        player.update(keys, self.grid, self.bushes)
+        self.profiler.mark("player")
+        self.scheduler.run(self.ticks, self.monsters, player, self.grid, self.flow, self.sight)
+        self.profiler.count("ai wait", self.scheduler.waiting)
+        self.profiler.mark("ai")
+        for m in self.monsters:
+            m.move(self.grid)
+            self.entities.move(m, m.rect)
+        self.profiler.mark("monsters")
+
+        # Only what shares a bucket with the player can touch it
+        touching = self.entities.query(player.rect)
+        for key in touching:
+            if isinstance(key, Monster) and not player.is_hidden:
+                player.health -= GHOST_DAMAGE
+                events.append("hit")
+
+        # Dead
+        if player.health <= 0:
+            events.append("dead")
+            self.profiler.mark("pickups")
+            return events
+
+        for key in touching:
+            if key in self.coins:
+                del self.coins[key]
+                self.entities.remove(key)
+                events.append("coin")
+
+                # Spawn health pack at half coins
+                if (not self.health_pack_spawned
+                    and len(self.coins) <= self.total_coins // 2):
+
+                    spawn_tile = self.rng.choice(self.floors)
+                    self.health_pack = pygame.Rect(0, 0, HEALTH_PACK_SIZE, HEALTH_PACK_SIZE)
+                    self.health_pack.center = spawn_tile.center
+                    self.entities.insert(HEALTH_PACK, self.health_pack)
+                    self.health_pack_spawned = True
+
+            # Health pack collection
+            elif key == HEALTH_PACK:
+                increase = player.health * self.heal_factor
+                player.health = min(player.health + increase, MAX_HEALTH)
+                self.health_pack = None  # remove it
+                self.entities.remove(HEALTH_PACK)
+                events.append("health")
+
+        if not self.coins:
+            events.append("cleared")
+        self.profiler.mark("pickups")
+        return events
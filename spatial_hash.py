@@ -0,0 +1,60 @@
+class SpatialHash:
+    """Uniform grid of buckets for things that move or disappear (ghosts, coins ...).
+
+    Every entry is a hashable key plus its rect, stored in each cell the rect
+    touches. query() only looks at the cells around the asked rect, so
+    contact and pickup checks don't grow with the number of entries.
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.buckets = {}  # (cx, cy) -> {key: rect}
+        self.entries = {}  # key -> (rect, cells)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def _cells(self, rect):
+        cs = self.cell_size
+        return tuple(
+            (cx, cy)
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1)
+            for cx in range(rect.left // cs, (rect.right - 1) // cs + 1)
+        )
+
+    def insert(self, key, rect):
+        cells = self._cells(rect)
+        self.entries[key] = (rect, cells)
+        for cell in cells:
+            self.buckets.setdefault(cell, {})[key] = rect
+
+    def remove(self, key):
+        rect, cells = self.entries.pop(key)
+        for cell in cells:
+            bucket = self.buckets[cell]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[cell]
+
+    def move(self, key, rect):
+        """Call after the key's rect changed; only touches buckets if it changed cell."""
+        old_rect, cells = self.entries[key]
+        if rect is old_rect and self._cells(rect) == cells:
+            return
+        self.remove(key)
+        self.insert(key, rect)
+
+    def query(self, rect):
+        """Keys whose rect overlaps rect, in a stable order."""
+        found = {}
+        for cell in self._cells(rect):
+            bucket = self.buckets.get(cell)
+            if not bucket:
+                continue
+            for key, r in bucket.items():
+                if key not in found and r.colliderect(rect):
+                    found[key] = None
+        return list(found)
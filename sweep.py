@@ -0,0 +1,159 @@
+"""Monte Carlo balance sweeps: many headless games per setting, on every core.
+
+python sweep.py                                  -> default grid, all levels
+python sweep.py --games 500 --levels 1,2
+python sweep.py --set ghosts=2,3,4 --set ghost_speed=2.0,3.0 --csv out.csv
+python sweep.py --policy bot                     -> the autopilot instead of a random walk
+
+Every combination of the grid is played `--games` times per level with the
+same seeds, so settings are compared on the same coin layouts and spawns.
+"""
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from multiprocessing import Pool
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from bot import Bot
+from settings import FPS, LEVELS
+from simulation import Simulation, LEFT, RIGHT, UP, DOWN, COIN_CHANCE, GHOST_DAMAGE, HEAL_FACTOR
+
+# Simulation keyword -> values to try (None = the game's own per-level value)
+GRID = {
+    "ghosts": [None, 2, 5],
+    "ghost_speed": [None, 2.0, 3.0],
+    "coin_chance": [COIN_CHANCE],
+    "heal_factor": [HEAL_FACTOR],
+}
+MAX_TICKS = 3 * 60 * FPS  # a game that hasn't ended after 3 minutes counts as a timeout
+
+
+class RandomWalk:
+    """Scripted stand-in player: holds a random direction for a random while."""
+
+    MOVES = [LEFT, RIGHT, UP, DOWN, LEFT | UP, LEFT | DOWN, RIGHT | UP, RIGHT | DOWN]
+
+    def __init__(self, sim, rng):
+        self.rng = rng
+        self.keys = 0
+        self.left = 0
+
+    def __call__(self):
+        if self.left <= 0:
+            self.keys = self.rng.choice(self.MOVES)
+            self.left = self.rng.randint(10, 40)
+        self.left -= 1
+        return self.keys
+
+
+# Name -> policy(sim, rng), a read_input() for the game
+POLICIES = {"random": RandomWalk, "bot": Bot}
+
+
+def play(job):
+    """Plays one level to the end and returns its outcome."""
+    level_idx, params, seed, policy, max_ticks = job
+    sim = Simulation(seed, **params)
+    if level_idx:
+        sim.start_level(level_idx)
+    read_input = POLICIES[policy](sim, random.Random(seed))
+    hits = 0
+    result = "timeout"
+    for tick in range(1, max_ticks + 1):
+        events = sim.step(read_input())
+        hits += events.count("hit")
+        if "dead" in events:
+            result = "dead"
+            break
+        if "cleared" in events:
+            result = "won"
+            break
+    return level_idx, tuple(sorted(params.items())), result, tick, hits * GHOST_DAMAGE
+
+
+def jobs(grid, levels, games, policy, seed=0, max_ticks=MAX_TICKS):
+    names = sorted(grid)
+    for level_idx in levels:
+        for values in itertools.product(*(grid[name] for name in names)):
+            params = {name: v for name, v in zip(names, values) if v is not None}
+            for i in range(games):
+                yield level_idx, params, seed + i, policy, max_ticks
+
+
+def sweep(grid=GRID, levels=range(len(LEVELS)), games=100, policy="random", processes=None, seed=0):
+    """Runs every job on a process pool and aggregates them per (level, settings)."""
+    todo = list(jobs(grid, levels, games, policy, seed))
+    processes = processes or os.cpu_count()
+    # Big enough chunks that pickling doesn't matter, small enough to balance the cores
+    chunksize = max(1, len(todo) // (processes * 8))
+    stats = {}
+    with Pool(processes) as pool:
+        for level_idx, params, result, ticks, damage in pool.imap_unordered(play, todo, chunksize):
+            s = stats.setdefault((level_idx, params), {"games": 0, "won": 0, "dead": 0, "clear_ticks": 0, "damage": 0.0})
+            s["games"] += 1
+            s["damage"] += damage
+            if result == "won":
+                s["won"] += 1
+                s["clear_ticks"] += ticks
+            elif result == "dead":
+                s["dead"] += 1
+
+    rows = []
+    for (level_idx, params), s in sorted(stats.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+        row = {"level": level_idx + 1}
+        for name in sorted(grid):
+            row[name] = dict(params).get(name, "level")
+        row.update({
+            "games": s["games"],
+            "win_rate": round(s["won"] / s["games"], 3),
+            "death_rate": round(s["dead"] / s["games"], 3),
+            "time_to_clear": round(s["clear_ticks"] / s["won"] / FPS, 1) if s["won"] else None,
+            "damage": round(s["damage"] / s["games"], 1),
+        })
+        rows.append(row)
+    return rows
+
+
+def format_table(rows):
+    if not rows:
+        return ""
+    headers = list(rows[0])
+    cells = [[("-" if row[h] is None else str(row[h])) for h in headers] for row in rows]
+    widths = [max(len(h), *(len(c[i]) for c in cells)) for i, h in enumerate(headers)]
+    lines = ["  ".join(h.rjust(w) for h, w in zip(headers, widths))]
+    lines += ["  ".join(c.rjust(w) for c, w in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+
+def _args():
+    grid = dict(GRID)
+    opts = {"games": 100, "levels": range(len(LEVELS)), "policy": "random", "processes": None, "csv": None}
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg == "--set":
+            name, values = next(args).split("=")
+            grid[name] = [None if v == "level" else float(v) if "." in v else int(v) for v in values.split(",")]
+        elif arg == "--levels":
+            opts["levels"] = [int(v) - 1 for v in next(args).split(",")]
+        elif arg in ("--games", "--processes"):
+            opts[arg[2:]] = int(next(args))
+        elif arg in ("--policy", "--csv"):
+            opts[arg[2:]] = next(args)
+    return grid, opts
+
+
+if __name__ == "__main__":
+    grid, opts = _args()
+    start = time.perf_counter()
+    rows = sweep(grid, opts["levels"], opts["games"], opts["policy"], opts["processes"])
+    print(format_table(rows))
+    print(f"{sum(r['games'] for r in rows)} games in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    if opts["csv"]:
+        with open(opts["csv"], "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
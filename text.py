@@ -0,0 +1,19 @@
+from functools import lru_cache
+
+import pygame
+
+# One font object per (name, size); SysFont scans the system fonts on every call
+_fonts = {}
+
+
+def get_font(name, size):
+    key = (name, size)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.SysFont(name, size)
+    return _fonts[key]
+
+
+@lru_cache(maxsize=256)
+def render_text(text, size, color, name=None):
+    """Rendered (antialiased) text surface, cached. Don't draw on the result."""
+    return get_font(name, size).render(text, True, color)
@@ -0,0 +1,127 @@
+import queue
+import threading
+
+import pygame
+
+from scenes import Scene
+
+
+class PngFrames:
+    """Frame source backed by one PNG file per frame."""
+
+    def __init__(self, paths):
+        self.paths = paths
+
+    def __len__(self):
+        return len(self.paths)
+
+    def frame(self, i):
+        return pygame.image.load(self.paths[i])
+
+
+class FrameStream:
+    """Decodes video frames on a background thread into a small ring buffer.
+
+    Only `buffer_size` frames exist at once. The player tells the stream which
+    frame is due with seek(); frames that are already late are skipped before
+    they are decoded.
+    """
+
+    def __init__(self, source, size, buffer_size=4):
+        self.source = source
+        self.size = size
+        self.frames = queue.Queue(maxsize=buffer_size)
+        self.wanted = 0
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._decode, daemon=True)
+        self.thread.start()
+
+    def _decode(self):
+        index = 0
+        while index < len(self.source) and not self.stopped.is_set():
+            index = max(index, self.wanted)
+            if index >= len(self.source):
+                break
+            img = self.source.frame(index)
+            if img.get_size() != self.size:
+                img = pygame.transform.scale(img, self.size)
+            if not self._put((index, img)):
+                return
+            index += 1
+        self._put(None)  # end of stream
+
+    def _put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.frames.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def seek(self, index):
+        self.wanted = index
+
+    def next_frame(self):
+        """(index, surface) of the next decoded frame, or None at the end."""
+        return self.frames.get()
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+class VideoScene(Scene):
+    """Streams frames from source (PngFrames or a FramePack) to the screen.
+
+    Each frame is shown at its wall-clock time, in sync with the sound. Late
+    frames are dropped so the picture never falls behind the audio. When the
+    video ends the manager switches to next_scene (or quits).
+    """
+
+    def __init__(self, source, fps, sound=None, next_scene=None):
+        self.source = source
+        self.fps = fps
+        self.sound = sound
+        self.next_scene = next_scene
+
+    def enter(self):
+        self.stream = FrameStream(self.source, self.manager.screen.get_size())
+        self.frame = None
+        self.pending = None
+        self.ended = False
+        if self.sound:
+            self.sound.play()
+        self.start = pygame.time.get_ticks()
+
+    def update(self, dt):
+        due = (pygame.time.get_ticks() - self.start) * self.fps // 1000
+        self.stream.seek(due)
+
+        # Take every decoded frame that is due, keep the newest one
+        while not self.ended:
+            if self.pending is None:
+                try:
+                    self.pending = self.stream.frames.get_nowait()
+                except queue.Empty:
+                    break
+                if self.pending is None:
+                    self.ended = True
+                    break
+            if self.pending[0] > due:
+                break
+            self.frame = self.pending[1]
+            self.pending = None
+
+        if self.ended and self.pending is None:
+            self.stream.close()
+            if hasattr(self.source, "close"):
+                self.source.close()  # a FramePack holds a file and an mmap
+            if self.next_scene:
+                self.manager.switch(self.next_scene)
+            else:
+                self.manager.quit()
+
+    def draw(self, screen):
+        if self.frame:
+            screen.blit(self.frame, (0, 0))
@@ -0,0 +1,126 @@
+"""Tile-to-tile line of sight for one level, precomputed at level load.
+
+python visibility.py  -> build time for the game's levels and a 100x100 maze
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from collision import TileGrid
+from settings import TILE_SIZE
+
+SIGHT_RADIUS = 12  # tiles; how far ghosts see on maps too big for a full table
+FULL_SIGHT = 40  # maps up to this many tiles across get unlimited sight
+
+
+def line_cells(dx, dy):
+    """The tiles strictly between (0, 0) and (dx, dy) on a Bresenham line."""
+    cells = []
+    x = y = 0
+    sx = 1 if dx > 0 else -1
+    sy = 1 if dy > 0 else -1
+    adx, ady = abs(dx), abs(dy)
+    err = adx - ady
+    while (x, y) != (dx, dy):
+        e2 = 2 * err
+        if e2 > -ady:
+            err -= ady
+            x += sx
+        if e2 < adx:
+            err += adx
+            y += sy
+        if (x, y) != (dx, dy):
+            cells.append((x, y))
+    return cells
+
+
+def sight_radius(rows, cols):
+    """A radius that covers the whole map on small maps, SIGHT_RADIUS on big ones."""
+    if max(rows, cols) <= FULL_SIGHT:
+        return math.ceil(math.hypot(rows - 1, cols - 1))
+    return SIGHT_RADIUS
+
+
+class VisibilityTable:
+    """Which tile sees which, one bit per (tile, offset within the radius).
+
+    A ray for a given offset crosses the same relative tiles wherever it
+    starts, so each offset is done for the whole map at once by ANDing the
+    open-tile grid shifted to every tile on the ray. The bits are packed per
+    tile, so a lookup is one index and one bit test.
+    """
+
+    def __init__(self, grid, radius=None):
+        rows, cols = grid.rows, grid.cols
+        r = sight_radius(rows, cols) if radius is None else radius
+        self.rows, self.cols, self.radius = rows, cols, r
+        walls = np.frombuffer(bytes(grid.cells), np.uint8).reshape(rows, cols) == 1
+        # Outside the map counts as wall; the padding keeps every shifted slice in range
+        open_tiles = np.pad(~walls, r, constant_values=False)
+        inside = np.pad(np.ones((rows, cols), bool), r, constant_values=False)
+
+        # Offsets that leave the map can never be seen, so they get no bit
+        offsets = [(dx, dy) for dy in range(-r, r + 1) for dx in range(-r, r + 1)
+                   if dx * dx + dy * dy <= r * r and abs(dx) < cols and abs(dy) < rows]
+        self.index = np.full((2 * r + 1, 2 * r + 1), -1, np.int64)  # (dy, dx) + r -> bit
+        seen = np.empty((rows, cols, len(offsets)), bool)
+        for i, (dx, dy) in enumerate(offsets):
+            self.index[dy + r, dx + r] = i
+            vis = inside[r + dy:r + dy + rows, r + dx:r + dx + cols].copy()
+            for cx, cy in line_cells(dx, dy):
+                np.logical_and(vis, open_tiles[r + cy:r + cy + rows, r + cx:r + cx + cols], out=vis)
+            seen[:, :, i] = vis
+        self.bits = np.packbits(seen, axis=2, bitorder="little")  # (rows, cols, bytes per tile)
+
+        # Plain Python copies for the scalar lookup, which runs per ghost per tick
+        self.stride = self.bits.shape[2]
+        self.flat_bits = self.bits.tobytes()
+        self.flat_index = self.index.ravel().tolist()
+
+    def visible(self, tx, ty, ux, uy):
+        """Can tile (tx, ty) see tile (ux, uy)?"""
+        r = self.radius
+        dx, dy = ux - tx, uy - ty
+        if not (-r <= dx <= r and -r <= dy <= r and 0 <= tx < self.cols and 0 <= ty < self.rows):
+            return False
+        i = self.flat_index[(dy + r) * (2 * r + 1) + dx + r]
+        if i < 0:
+            return False
+        return self.flat_bits[(ty * self.cols + tx) * self.stride + (i >> 3)] >> (i & 7) & 1 == 1
+
+    def visible_array(self, tx, ty, ux, uy):
+        """visible() for NumPy arrays of tiles (broadcast together)."""
+        r = self.radius
+        dx, dy = ux - tx, uy - ty
+        i = self.index[np.clip(dy + r, 0, 2 * r), np.clip(dx + r, 0, 2 * r)]
+        ok = (np.abs(dx) <= r) & (np.abs(dy) <= r) & (i >= 0)
+        ok &= (tx >= 0) & (tx < self.cols) & (ty >= 0) & (ty < self.rows)
+        i = np.maximum(i, 0)
+        byte = self.bits[np.clip(ty, 0, self.rows - 1), np.clip(tx, 0, self.cols - 1), i >> 3]
+        return ok & ((byte >> (i & 7)) & 1).astype(bool)
+
+
+@lru_cache(maxsize=16)
+def _level_table(level_map):
+    return VisibilityTable(TileGrid(level_map, TILE_SIZE))
+
+
+def for_level(level_map):
+    """The table for a level map, built once and shared. Don't change it."""
+    return _level_table(tuple(level_map))
+
+
+if __name__ == "__main__":
+    import time
+
+    from maze_gen import generate_level
+    from settings import LEVELS
+
+    maps = [(f"level {i + 1}", m) for i, m in enumerate(LEVELS)]
+    maps.append(("maze 100x100", generate_level(100, 100, seed=1)))
+    for name, level_map in maps:
+        start = time.perf_counter()
+        table = VisibilityTable(TileGrid(level_map, TILE_SIZE))
+        print(f"{name}: radius {table.radius}, {(time.perf_counter() - start) * 1000:.0f} ms, "
+              f"{table.bits.nbytes // 1024} KiB")